@@ -7,21 +7,22 @@ SSCI旅游学术趋势分析系统 - Web UI界面
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+import io
 import os
 import sys
 import json
+import uuid
+import zlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # 添加模块路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.data_fetcher import DataFetcher
-from modules.file_importer import FileImporter
-from modules.text_processor import TextProcessor
-from modules.analyzer import TrendAnalyzer
-from modules.visualizer import Visualizer
-from modules.ai_advisor import AIAdvisor
+# 各模块在实际用到的分支内延迟导入，缩短Streamlit冷启动时间
 
 # 页面配置
 st.set_page_config(
@@ -80,6 +81,8 @@ st.markdown("""
 # 初始化session state
 if 'data' not in st.session_state:
     st.session_state.data = None
+if 'data_id' not in st.session_state:
+    st.session_state.data_id = None
 if 'processed_data' not in st.session_state:
     st.session_state.processed_data = None
 if 'analysis_results' not in st.session_state:
@@ -88,15 +91,155 @@ if 'topics' not in st.session_state:
     st.session_state.topics = None
 
 
+def _read_csv_fast(src):
+    """读取CSV，优先使用pyarrow多线程解析，未安装时回退到C引擎"""
+    try:
+        return pd.read_csv(src, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(src, engine="c", low_memory=False, cache_dates=True)
+
+
+@st.cache_data(show_spinner=False)
+def _read_demo_file(demo_file, mtime):
+    """读取Demo数据文件（mtime参与缓存键，文件重新生成后缓存自动失效）"""
+    if demo_file.endswith('.parquet'):
+        return _post_load(pd.read_parquet(demo_file))
+    return _post_load(_read_csv_fast(demo_file))
+
+
 def load_demo_data():
-    """加载或生成Demo数据"""
+    """加载或生成Demo数据（磁盘缓存用Parquet，对长摘要文本的往返远快于CSV）"""
     from generate_demo_data import generate_demo_data
-    
-    demo_file = "demo_data.csv"
+
+    demo_file = "demo_data.parquet"
     if not os.path.exists(demo_file):
-        generate_demo_data(200, demo_file)
-    
-    return pd.read_csv(demo_file)
+        papers = generate_demo_data(200, "demo_data.csv")
+        df = _post_load(pd.DataFrame(papers))
+        try:
+            df.to_parquet(demo_file, compression='snappy')
+        except ImportError:
+            # 未安装pyarrow时直接返回内存中的DataFrame，下次从CSV重建
+            return df
+
+    return _read_demo_file(demo_file, os.path.getmtime(demo_file))
+
+
+def _post_load(df):
+    """加载后统一收窄dtype，缩减缓存拷贝与前端序列化的内存开销"""
+    for col, dt in (('year', 'int16'), ('citations', 'int32')):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dt)
+    # 仅journal列转category：authors在抓取/导入路径里是字符串列表
+    # （不可哈希），astype('category')会直接抛TypeError
+    if 'journal' in df.columns and df['journal'].dtype == object:
+        df['journal'] = df['journal'].astype('category')
+    return df
+
+
+# 数据集在入库时打上uuid指纹（data_id），各缓存以指纹为键，
+# 避免对整个DataFrame做O(n)哈希——DataFrame本身以下划线参数绕过哈希。
+@st.cache_data(show_spinner=False)
+def _csv_bytes(data_id, _df):
+    """导出CSV为bytes（分块写入缓冲区，并按数据集缓存避免每次rerun重新编码）"""
+    buf = io.BytesIO()
+    _df.to_csv(buf, index=False, encoding='utf-8-sig', chunksize=20_000)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _data_summary(data_id, _df):
+    """数据概览统计（按数据集指纹缓存，rerun时免去整列扫描）"""
+    summary = {'n': len(_df)}
+    if 'year' in _df.columns:
+        summary['year_min'] = _df['year'].min()
+        summary['year_max'] = _df['year'].max()
+    if 'journal' in _df.columns:
+        summary['n_journals'] = _df['journal'].nunique()
+    if 'citations' in _df.columns:
+        summary['mean_citations'] = float(_df['citations'].mean())
+    return summary
+
+
+@st.cache_data(show_spinner=False)
+def _viz_aggregates(data_id, _df):
+    """可视化标签页的聚合数据（按数据集指纹缓存，切换图表类型不重算）"""
+    agg = {}
+    if 'year' in _df.columns:
+        agg['yearly'] = _df.groupby('year').size()
+    if 'citations' in _df.columns:
+        agg['cit_sum'] = int(_df['citations'].sum())
+        agg['cit_mean'] = float(_df['citations'].mean())
+        agg['cit_max'] = int(_df['citations'].max())
+        # bincount一趟扫描代替value_counts的哈希计数+排序
+        c = np.minimum(_df['citations'].to_numpy(dtype=np.int32), 20)
+        agg['hist_data'] = pd.Series(np.bincount(c, minlength=21)[:20])
+        cols = [c for c in ('title', 'year', 'citations', 'journal') if c in _df.columns]
+        agg['top_cited'] = _df.nlargest(10, 'citations')[cols]
+    return agg
+
+
+@st.cache_resource
+def _get_analyzer():
+    """TrendAnalyzer单例，避免每次点击按钮重新初始化"""
+    from modules.analyzer import TrendAnalyzer
+    return TrendAnalyzer()
+
+
+@st.cache_resource
+def _get_importer():
+    """FileImporter单例"""
+    from modules.file_importer import FileImporter
+    return FileImporter()
+
+
+@st.cache_resource
+def _get_advisor():
+    """AIAdvisor单例（复用API客户端与磁盘缓存实例）"""
+    from modules.ai_advisor import AIAdvisor
+    return AIAdvisor()
+
+
+@st.cache_data(show_spinner=False)
+def _process_data(data_id, _data):
+    """文本预处理（同一份数据只处理一次）"""
+    from modules.text_processor import TextProcessor
+    processor = TextProcessor()
+    return processor.process_papers(_data.to_dict('records'))
+
+
+@st.cache_data(show_spinner=False)
+def _run_analysis(processed):
+    """关键词/突发词/共现/缺口分析（结果按输入内容缓存）"""
+    analyzer = _get_analyzer()
+    keyword_stats = analyzer.analyze_keywords(processed)
+    burst_words = analyzer.detect_burst_words(processed)
+    network = analyzer.build_cooccurrence_network(processed)
+    gaps = analyzer.identify_research_gaps(processed)
+    return {
+        'top_keywords': list(keyword_stats.items()),
+        'burst_words': [(bw['keyword'], bw['growth_rate']) for bw in burst_words],
+        'cooccurrence': {(e['source'], e['target']): e['weight'] for e in network['edges']},
+        'research_gaps': [g['description'] for g in gaps],
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _kw_series(top_kw_tuple):
+    """高频关键词Series（元组键哈希便宜，rerun时免去DataFrame重建）"""
+    return pd.Series(dict(top_kw_tuple), name='频次').rename_axis('关键词')
+
+
+def _processed_fingerprint(processed):
+    """预处理结果的轻量校验和（adler32比逐条哈希dict便宜得多）"""
+    return zlib.adler32(repr(processed).encode('utf-8', 'ignore'))
+
+
+@st.cache_data(show_spinner=False)
+def _run_lda(processed_id, n_topics, _processed):
+    """LDA主题建模（缓存键为内容指纹+主题数，调参扫描时只有新主题数触发真实计算）"""
+    analyzer = _get_analyzer()
+    analyzer.n_topics = n_topics
+    return analyzer.lda_topic_modeling(_processed)
 
 
 def main():
@@ -159,32 +302,42 @@ def main():
                 st.markdown("### 上传本地文件")
                 st.markdown("支持格式: CSV, TXT (WoS), BibTeX, RIS")
                 
-                uploaded_file = st.file_uploader(
-                    "拖拽或点击上传文件",
+                uploaded_files = st.file_uploader(
+                    "拖拽或点击上传文件（可多选）",
                     type=['csv', 'txt', 'bib', 'ris'],
-                    help="支持Web of Science、Scopus导出文件"
+                    accept_multiple_files=True,
+                    help="支持Web of Science、Scopus导出文件，可一次上传多个批次"
                 )
                 
-                if uploaded_file is not None:
+                if uploaded_files:
                     try:
-                        # 保存上传的文件
-                        file_path = f"temp_{uploaded_file.name}"
-                        with open(file_path, 'wb') as f:
-                            f.write(uploaded_file.getbuffer())
-                        
-                        # 导入文件
-                        importer = FileImporter()
-                        data = importer.import_file(file_path)
-                        
-                        if data is not None and len(data) > 0:
-                            st.session_state.data = data
-                            st.success(f"✅ 成功加载 {len(data)} 条文献记录!")
+                        # 直接在内存中解析上传内容，多文件用线程池并行
+                        # （pandas的CSV解析在C层释放GIL，可跨核重叠）
+                        importer = _get_importer()
+                        progress_bar = st.progress(0.0)
+
+                        def _parse_one(f):
+                            return importer.import_file(
+                                io.BytesIO(f.getbuffer()),
+                                suffix=f.name.split('.')[-1]
+                            )
+
+                        papers = []
+                        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as ex:
+                            futures = [ex.submit(_parse_one, f) for f in uploaded_files]
+                            for done, fut in enumerate(as_completed(futures), 1):
+                                progress_bar.progress(done / len(futures))
+                            for fut in futures:  # 按上传顺序合并
+                                papers.extend(fut.result())
+                        progress_bar.empty()
+
+                        if papers:
+                            st.session_state.data = _post_load(pd.DataFrame(papers))
+                            st.session_state.data_id = uuid.uuid4().hex
+                            st.success(f"✅ 成功加载 {len(papers)} 条文献记录!")
                         else:
                             st.error("❌ 文件解析失败，请检查格式")
-                        
-                        # 清理临时文件
-                        os.remove(file_path)
-                        
+
                     except Exception as e:
                         st.error(f"❌ 加载失败: {str(e)}")
             
@@ -210,19 +363,23 @@ def main():
                     if keywords:
                         with st.spinner("正在从OpenAlex获取数据..."):
                             try:
+                                from modules.data_fetcher import DataFetcher
+                                progress_bar = st.progress(0.0)
                                 fetcher = DataFetcher()
                                 papers = fetcher.fetch_papers(
                                     keywords=keywords.split(),
                                     year_start=year_start,
                                     year_end=year_end,
-                                    max_results=max_results
+                                    max_results=max_results,
+                                    progress_callback=lambda done, total: progress_bar.progress(done / total)
                                 )
+                                progress_bar.empty()
                                 # 转换为DataFrame
-                                import pandas as pd
-                                data = pd.DataFrame(papers) if papers else None
+                                data = _post_load(pd.DataFrame(papers)) if papers else None
                                 
                                 if data is not None and len(data) > 0:
                                     st.session_state.data = data
+                                    st.session_state.data_id = uuid.uuid4().hex
                                     st.success(f"✅ 成功获取 {len(data)} 条文献记录!")
                                 else:
                                     st.warning("⚠️ 未找到相关文献，请尝试其他关键词")
@@ -241,6 +398,7 @@ def main():
                         try:
                             data = load_demo_data()
                             st.session_state.data = data
+                            st.session_state.data_id = uuid.uuid4().hex
                             st.success(f"✅ 成功加载 {len(data)} 条Demo数据!")
                         except Exception as e:
                             st.error(f"❌ 加载失败: {str(e)}")
@@ -248,33 +406,30 @@ def main():
         with col2:
             st.markdown("### 📊 数据预览")
             if st.session_state.data is not None:
-                df = st.session_state.data
-                
-                # 统计信息
-                st.metric("论文总数", len(df))
-                if 'year' in df.columns:
-                    st.metric("时间范围", f"{df['year'].min()} - {df['year'].max()}")
-                if 'journal' in df.columns:
-                    st.metric("期刊数量", df['journal'].nunique())
-                if 'citations' in df.columns:
-                    st.metric("平均被引", f"{df['citations'].mean():.1f}")
+                # 统计信息（缓存的聚合结果，rerun不重复扫描整列）
+                summary = _data_summary(st.session_state.data_id, st.session_state.data)
+                st.metric("论文总数", summary['n'])
+                if 'year_min' in summary:
+                    st.metric("时间范围", f"{summary['year_min']} - {summary['year_max']}")
+                if 'n_journals' in summary:
+                    st.metric("期刊数量", summary['n_journals'])
+                if 'mean_citations' in summary:
+                    st.metric("平均被引", f"{summary['mean_citations']:.1f}")
         
         # 数据表格展示
         if st.session_state.data is not None:
             st.markdown("### 📋 数据详情")
             
-            # 显示前10条
-            display_df = st.session_state.data.head(10).copy()
-            if 'abstract' in display_df.columns:
-                display_df['abstract'] = display_df['abstract'].str[:100] + '...'
-            
+            # 显示前10条（去掉重量级长文本列，减少序列化到前端的数据量）
+            drop_cols = [c for c in ('abstract', 'references') if c in st.session_state.data.columns]
+            display_df = st.session_state.data.head(10).drop(columns=drop_cols)
+
             st.dataframe(display_df, use_container_width=True)
             
-            # 下载按钮
-            csv = st.session_state.data.to_csv(index=False, encoding='utf-8-sig')
+            # 下载按钮（缓存的bytes，rerun不重新序列化整个DataFrame）
             st.download_button(
                 "📥 下载完整数据 (CSV)",
-                csv,
+                _csv_bytes(st.session_state.data_id, st.session_state.data),
                 "ssci_data.csv",
                 "text/csv"
             )
@@ -289,14 +444,13 @@ def main():
             if st.button("🚀 开始关键词分析", type="primary"):
                 with st.spinner("正在分析关键词..."):
                     try:
-                        # 文本预处理
-                        processor = TextProcessor()
-                        processed = processor.process(st.session_state.data)
+                        # 文本预处理（缓存）
+                        processed = _process_data(st.session_state.data_id, st.session_state.data)
                         st.session_state.processed_data = processed
-                        
-                        # 关键词分析
-                        analyzer = TrendAnalyzer()
-                        results = analyzer.analyze(processed)
+                        st.session_state.processed_id = _processed_fingerprint(processed)
+
+                        # 关键词分析（缓存）
+                        results = _run_analysis(processed)
                         st.session_state.analysis_results = results
                         
                         st.success("✅ 分析完成!")
@@ -313,21 +467,24 @@ def main():
                 with col1:
                     st.markdown("### 📊 高频关键词 Top 20")
                     if 'top_keywords' in results:
-                        kw_df = pd.DataFrame(results['top_keywords'][:20], columns=['关键词', '频次'])
+                        kw_series = _kw_series(tuple(map(tuple, results['top_keywords'][:20])))
                         
                         # 条形图
-                        st.bar_chart(kw_df.set_index('关键词'))
+                        st.bar_chart(kw_series)
                         
                         # 表格
-                        st.dataframe(kw_df, use_container_width=True)
+                        st.dataframe(kw_series.reset_index(), use_container_width=True)
                 
                 with col2:
                     st.markdown("### 🔥 突发词 (Burst Words)")
                     st.markdown("*近期热度飙升的关键词*")
                     
                     if 'burst_words' in results and results['burst_words']:
-                        for word, score in results['burst_words'][:10]:
-                            st.markdown(f"⚡ **{word}** (突发指数: {score:.2f})")
+                        # 一次st.dataframe调用代替逐条st.markdown，减少前端消息数
+                        burst_df = pd.DataFrame(
+                            results['burst_words'][:10], columns=['突发词', '突发指数']
+                        )
+                        st.dataframe(burst_df, use_container_width=True, hide_index=True)
                     else:
                         st.info("未检测到明显的突发词")
                     
@@ -335,8 +492,11 @@ def main():
                     st.markdown("### 🕳️ 潜在研究缺口")
                     
                     if 'research_gaps' in results and results['research_gaps']:
-                        for i, gap in enumerate(results['research_gaps'][:5], 1):
-                            st.markdown(f"💡 {i}. {gap}")
+                        # 拼成一段Markdown一次性渲染
+                        st.markdown("\n".join(
+                            f"💡 {i}. {gap}"
+                            for i, gap in enumerate(results['research_gaps'][:5], 1)
+                        ))
                     else:
                         st.info("请完成LDA主题建模以获取研究缺口")
     
@@ -355,10 +515,10 @@ def main():
                 if st.button("🧠 运行LDA建模", type="primary"):
                     with st.spinner("正在进行主题建模..."):
                         try:
-                            analyzer = TrendAnalyzer()
-                            topics = analyzer.lda_topic_modeling(
-                                st.session_state.processed_data, 
-                                n_topics=n_topics
+                            topics = _run_lda(
+                                st.session_state.processed_id,
+                                n_topics,
+                                st.session_state.processed_data
                             )
                             st.session_state.topics = topics
                             st.success("✅ 主题建模完成!")
@@ -394,10 +554,9 @@ def main():
                 
                 if 'top_keywords' in st.session_state.analysis_results:
                     kw_data = st.session_state.analysis_results['top_keywords'][:30]
-                    df = pd.DataFrame(kw_data, columns=['keyword', 'frequency'])
                     
                     # 使用Streamlit原生图表
-                    st.bar_chart(df.set_index('keyword'))
+                    st.bar_chart(_kw_series(tuple(map(tuple, kw_data))))
             
             elif "共现" in viz_type:
                 st.markdown("### 🕸️ 关键词共现网络")
@@ -408,8 +567,10 @@ def main():
                     
                     # 显示共现对
                     st.markdown("**高频共现词对:**")
-                    for pair, count in list(cooc.items())[:15]:
-                        st.markdown(f"- {pair[0]} ↔ {pair[1]}: {count}次")
+                    st.markdown("\n".join(
+                        f"- {pair[0]} ↔ {pair[1]}: {count}次"
+                        for pair, count in list(cooc.items())[:15]
+                    ))
                 else:
                     st.warning("需要先运行关键词分析")
             
@@ -417,7 +578,7 @@ def main():
                 st.markdown("### 📅 关键词年度趋势")
                 
                 if st.session_state.data is not None and 'year' in st.session_state.data.columns:
-                    yearly = st.session_state.data.groupby('year').size()
+                    yearly = _viz_aggregates(st.session_state.data_id, st.session_state.data)['yearly']
                     st.line_chart(yearly)
                     
                     st.markdown("**各年度论文数量:**")
@@ -427,22 +588,20 @@ def main():
                 st.markdown("### 📈 被引分析")
                 
                 if st.session_state.data is not None and 'citations' in st.session_state.data.columns:
-                    df = st.session_state.data
-                    
+                    agg = _viz_aggregates(st.session_state.data_id, st.session_state.data)
+
                     col1, col2, col3 = st.columns(3)
-                    col1.metric("总被引次数", int(df['citations'].sum()))
-                    col2.metric("平均被引", f"{df['citations'].mean():.1f}")
-                    col3.metric("最高被引", int(df['citations'].max()))
-                    
+                    col1.metric("总被引次数", agg['cit_sum'])
+                    col2.metric("平均被引", f"{agg['cit_mean']:.1f}")
+                    col3.metric("最高被引", agg['cit_max'])
+
                     # 被引分布
                     st.markdown("**被引次数分布:**")
-                    hist_data = df['citations'].value_counts().sort_index().head(20)
-                    st.bar_chart(hist_data)
-                    
+                    st.bar_chart(agg['hist_data'])
+
                     # 高被引论文
                     st.markdown("**🏆 高被引论文 Top 10:**")
-                    top_cited = df.nlargest(10, 'citations')[['title', 'year', 'citations', 'journal']]
-                    st.dataframe(top_cited, use_container_width=True)
+                    st.dataframe(agg['top_cited'], use_container_width=True)
     
     # ==================== Tab 5: AI助手 ====================
     with tab5:
@@ -498,7 +657,7 @@ def main():
             if st.button("✨ 生成选题建议", type="primary"):
                 with st.spinner("AI正在分析并生成建议..."):
                     try:
-                        advisor = AIAdvisor()
+                        advisor = _get_advisor()
                         
                         context = {
                             'data': st.session_state.data,
@@ -507,7 +666,7 @@ def main():
                             'focus': focus_area
                         }
                         
-                        suggestions = advisor.generate_topic_suggestions(context)
+                        suggestions = asyncio.run(advisor.agenerate_topic_suggestions(context))
                         
                         st.markdown("### 📋 选题建议")
                         st.markdown(suggestions)
@@ -526,8 +685,8 @@ def main():
             if st.button("📄 生成写作框架", type="primary"):
                 with st.spinner("生成写作框架..."):
                     try:
-                        advisor = AIAdvisor()
-                        framework = advisor.generate_writing_framework(paper_topic)
+                        advisor = _get_advisor()
+                        framework = asyncio.run(advisor.agenerate_writing_framework(paper_topic))
                         
                         st.markdown("### 📑 建议的论文框架")
                         st.markdown(framework)
@@ -544,7 +703,7 @@ def main():
             if st.button("🔎 分析研究缺口", type="primary"):
                 with st.spinner("深度分析研究缺口..."):
                     try:
-                        advisor = AIAdvisor()
+                        advisor = _get_advisor()
                         
                         context = {
                             'data': st.session_state.data,
@@ -552,7 +711,7 @@ def main():
                             'topics': st.session_state.topics
                         }
                         
-                        gaps = advisor.analyze_research_gaps(context)
+                        gaps = asyncio.run(advisor.aanalyze_research_gaps(context))
                         
                         st.markdown("### 🕳️ 研究缺口分析报告")
                         st.markdown(gaps)
@@ -573,7 +732,7 @@ def main():
                 if user_question:
                     with st.spinner("思考中..."):
                         try:
-                            advisor = AIAdvisor()
+                            advisor = _get_advisor()
                             
                             context = {
                                 'data': st.session_state.data,
@@ -581,7 +740,7 @@ def main():
                                 'question': user_question
                             }
                             
-                            answer = advisor.answer_question(context)
+                            answer = asyncio.run(advisor.aanswer_question(context))
                             
                             st.markdown("### 💡 建议")
                             st.markdown(answer)
@@ -20,16 +20,14 @@ import sys
 # 添加模块路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.data_fetcher import DataFetcher
-from modules.file_importer import FileImporter
-from modules.text_processor import TextProcessor
-from modules.analyzer import TrendAnalyzer
-from modules.visualizer import Visualizer
-from modules.ai_advisor import AIAdvisor
+# 各功能组件改为在实际用到的分支内延迟导入，
+# --help或仅导入文件等轻路径不再拉起matplotlib/anthropic等重依赖
 from modules.utils import setup_logging, print_banner
 
 import argparse
+import io
 import logging
+from collections import Counter
 
 def main():
     """主程序入口"""
@@ -102,19 +100,13 @@ def main():
     # 创建输出目录
     os.makedirs(args.output, exist_ok=True)
     
-    # 初始化组件
-    fetcher = DataFetcher()
-    importer = FileImporter()
-    processor = TextProcessor()
-    analyzer = TrendAnalyzer(n_topics=args.lda_topics)
-    visualizer = Visualizer(output_dir=args.output)
-    advisor = AIAdvisor(api_key=args.api_key)
-    
     papers = []
+    # 分析结果显式初始化为None，后续直接引用，不再逐处探测变量是否已定义
+    keyword_stats = burst_words = topics = gaps = None
     
     # 交互模式
     if args.interactive:
-        run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, advisor, args.output)
+        run_interactive_mode(args.output, n_topics=args.lda_topics, api_key=args.api_key)
         return
     
     # 数据获取
@@ -127,7 +119,8 @@ def main():
         year_start, year_end = map(int, args.years.split('-'))
         
         logger.info(f"正在获取数据: 关键词={keywords}, 年份={year_start}-{year_end}")
-        papers = fetcher.fetch_papers(
+        from modules.data_fetcher import DataFetcher
+        papers = DataFetcher().fetch_papers(
             keywords=keywords,
             year_start=year_start,
             year_end=year_end,
@@ -136,6 +129,10 @@ def main():
         logger.info(f"获取到 {len(papers)} 篇论文")
     
     # 文件导入
+    if args.import_wos or args.import_scopus or args.import_csv:
+        from modules.file_importer import FileImporter
+        importer = FileImporter()
+
     if args.import_wos:
         logger.info(f"导入WoS文件: {args.import_wos}")
         imported = importer.import_wos(args.import_wos)
@@ -159,10 +156,13 @@ def main():
         if not args.interactive:
             # 生成演示数据
             logger.info("生成演示数据以展示系统功能...")
-            papers = fetcher.generate_demo_data()
+            from modules.data_fetcher import DataFetcher
+            papers = DataFetcher().generate_demo_data()
     
     # 文本预处理
     logger.info("正在进行文本预处理...")
+    from modules.text_processor import TextProcessor
+    processor = TextProcessor()
     processed_papers = processor.process_papers(papers)
     
     # 保存处理后的数据
@@ -173,6 +173,8 @@ def main():
     # 执行分析
     if args.analyze or True:  # 默认执行分析
         logger.info("正在执行趋势分析...")
+        from modules.analyzer import TrendAnalyzer
+        analyzer = TrendAnalyzer(n_topics=args.lda_topics)
         
         # 关键词分析
         keyword_stats = analyzer.analyze_keywords(processed_papers)
@@ -193,6 +195,8 @@ def main():
         # 可视化
         if not args.no_viz:
             logger.info("正在生成可视化图表...")
+            from modules.visualizer import Visualizer
+            visualizer = Visualizer(output_dir=args.output)
             visualizer.plot_keyword_trends(keyword_stats)
             visualizer.plot_cooccurrence_network(processed_papers)
             visualizer.plot_yearly_heatmap(processed_papers)
@@ -203,9 +207,11 @@ def main():
     # AI辅助建议
     if args.ai_suggest:
         logger.info("正在生成AI辅助选题建议...")
+        from modules.ai_advisor import AIAdvisor
+        advisor = AIAdvisor(api_key=args.api_key)
         suggestions = advisor.generate_suggestions(
             papers=processed_papers,
-            gaps=gaps if 'gaps' in locals() else None,
+            gaps=gaps,
             focus_area=args.focus
         )
         advisor.save_suggestions(suggestions, os.path.join(args.output, 'ai_suggestions.md'))
@@ -215,10 +221,10 @@ def main():
     logger.info("正在生成综合分析报告...")
     generate_report(
         papers=processed_papers,
-        keyword_stats=keyword_stats if 'keyword_stats' in locals() else None,
-        burst_words=burst_words if 'burst_words' in locals() else None,
-        topics=topics if 'topics' in locals() else None,
-        gaps=gaps if 'gaps' in locals() else None,
+        keyword_stats=keyword_stats,
+        burst_words=burst_words,
+        topics=topics,
+        gaps=gaps,
         output_dir=args.output
     )
     
@@ -228,14 +234,71 @@ def main():
     logger.info("=" * 60)
 
 
-def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, advisor, output_dir):
-    """交互式运行模式"""
+def run_interactive_mode(output_dir, n_topics=8, api_key=None):
+    """交互式运行模式（组件在首次用到的菜单项中才导入构造）"""
+    components = {}
+
+    def _get(name):
+        if name not in components:
+            if name == 'fetcher':
+                from modules.data_fetcher import DataFetcher
+                components[name] = DataFetcher()
+            elif name == 'importer':
+                from modules.file_importer import FileImporter
+                components[name] = FileImporter()
+            elif name == 'processor':
+                from modules.text_processor import TextProcessor
+                components[name] = TextProcessor()
+            elif name == 'analyzer':
+                from modules.analyzer import TrendAnalyzer
+                components[name] = TrendAnalyzer(n_topics=n_topics)
+            elif name == 'visualizer':
+                from modules.visualizer import Visualizer
+                components[name] = Visualizer(output_dir=output_dir)
+            elif name == 'advisor':
+                from modules.ai_advisor import AIAdvisor
+                components[name] = AIAdvisor(api_key=api_key)
+        return components[name]
+
     print("\n" + "=" * 60)
     print("📚 SSCI旅游学术趋势分析系统 - 交互模式")
     print("=" * 60)
     
     papers = []
-    
+
+    # 同一份数据的预处理/统计/主题结果只算一次，重复选同一菜单项直接复用。
+    # 失效有两道保险：选项1/2/3在改动数据后显式cache.clear()（脏标记），
+    # (id, len)键则兜底防止遗漏——单靠id并不可靠，重建的列表可能复用地址
+    cache = {'key': None}
+
+    def get_processed():
+        key = (id(papers), len(papers))
+        if cache.get('key') != key:
+            cache.clear()
+            cache['key'] = key
+            cache['processed'] = _get('processor').process_papers(papers)
+        return cache['processed']
+
+    def get_stats():
+        processed = get_processed()
+        if 'stats' not in cache:
+            cache['stats'] = _get('analyzer').analyze_keywords(processed)
+        return cache['stats']
+
+    def get_burst():
+        processed = get_processed()
+        if 'burst' not in cache:
+            cache['burst'] = _get('analyzer').detect_burst_words(processed)
+        return cache['burst']
+
+    def get_topics():
+        processed = get_processed()
+        analyzer = _get('analyzer')
+        if cache.get('topics_n') != analyzer.n_topics:
+            cache['topics'] = analyzer.lda_topic_modeling(processed)
+            cache['topics_n'] = analyzer.n_topics
+        return cache['topics']
+
     while True:
         print("\n请选择操作：")
         print("1. 从OpenAlex获取数据")
@@ -264,8 +327,9 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
                 max_results = int(input("最大获取数量（直接回车默认500）: ").strip() or "500")
                 
                 print(f"\n正在获取数据...")
-                new_papers = fetcher.fetch_papers(keywords_list, year_start, year_end, max_results)
+                new_papers = _get('fetcher').fetch_papers(keywords_list, year_start, year_end, max_results)
                 papers.extend(new_papers)
+                cache.clear()
                 print(f"✓ 获取到 {len(new_papers)} 篇论文，当前共 {len(papers)} 篇")
         
         elif choice == '2':
@@ -273,6 +337,7 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
             file_path = input("文件路径: ").strip()
             
             if os.path.exists(file_path):
+                importer = _get('importer')
                 if file_type == 'wos':
                     new_papers = importer.import_wos(file_path)
                 elif file_type == 'scopus':
@@ -280,23 +345,24 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
                 else:
                     new_papers = importer.import_csv(file_path)
                 papers.extend(new_papers)
+                cache.clear()
                 print(f"✓ 导入 {len(new_papers)} 篇论文，当前共 {len(papers)} 篇")
             else:
                 print("❌ 文件不存在")
         
         elif choice == '3':
-            papers = fetcher.generate_demo_data()
+            papers = _get('fetcher').generate_demo_data()
+            cache.clear()
             print(f"✓ 已加载 {len(papers)} 篇演示数据")
         
         elif choice == '4':
             if not papers:
                 print("❌ 请先获取或导入数据")
                 continue
-            processed = processor.process_papers(papers)
-            stats = analyzer.analyze_keywords(processed)
-            burst = analyzer.detect_burst_words(processed)
-            analyzer.save_keyword_stats(stats, os.path.join(output_dir, 'keyword_analysis.csv'))
-            analyzer.save_burst_words(burst, os.path.join(output_dir, 'burst_words.csv'))
+            stats = get_stats()
+            burst = get_burst()
+            _get('analyzer').save_keyword_stats(stats, os.path.join(output_dir, 'keyword_analysis.csv'))
+            _get('analyzer').save_burst_words(burst, os.path.join(output_dir, 'burst_words.csv'))
             print("✓ 关键词分析完成，结果已保存")
             print("\n📊 Top 10 高频关键词：")
             for i, (kw, freq) in enumerate(list(stats.items())[:10], 1):
@@ -307,10 +373,9 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
                 print("❌ 请先获取或导入数据")
                 continue
             n_topics = int(input("主题数量（默认8）: ").strip() or "8")
-            analyzer.n_topics = n_topics
-            processed = processor.process_papers(papers)
-            topics = analyzer.lda_topic_modeling(processed)
-            analyzer.save_topics(topics, os.path.join(output_dir, 'lda_topics.txt'))
+            _get('analyzer').n_topics = n_topics
+            topics = get_topics()
+            _get('analyzer').save_topics(topics, os.path.join(output_dir, 'lda_topics.txt'))
             print("✓ LDA主题建模完成")
             print("\n📚 发现的研究主题：")
             for i, topic in enumerate(topics, 1):
@@ -320,11 +385,12 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
             if not papers:
                 print("❌ 请先获取或导入数据")
                 continue
-            processed = processor.process_papers(papers)
-            stats = analyzer.analyze_keywords(processed)
-            topics = analyzer.lda_topic_modeling(processed)
+            processed = get_processed()
+            stats = get_stats()
+            topics = get_topics()
             
             print("正在生成图表...")
+            visualizer = _get('visualizer')
             visualizer.plot_keyword_trends(stats)
             visualizer.plot_cooccurrence_network(processed)
             visualizer.plot_yearly_heatmap(processed)
@@ -337,10 +403,11 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
                 print("❌ 请先获取或导入数据")
                 continue
             focus = input("研究聚焦方向（可选，直接回车跳过）: ").strip() or None
-            processed = processor.process_papers(papers)
-            gaps = analyzer.identify_research_gaps(processed)
+            processed = get_processed()
+            gaps = _get('analyzer').identify_research_gaps(processed)
             
             print("\n正在生成AI辅助建议...")
+            advisor = _get('advisor')
             suggestions = advisor.generate_suggestions(processed, gaps, focus)
             advisor.save_suggestions(suggestions, os.path.join(output_dir, 'ai_suggestions.md'))
             print(f"✓ AI建议已保存至: {output_dir}/ai_suggestions.md")
@@ -351,11 +418,11 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
             if not papers:
                 print("❌ 请先获取或导入数据")
                 continue
-            processed = processor.process_papers(papers)
-            stats = analyzer.analyze_keywords(processed)
-            burst = analyzer.detect_burst_words(processed)
-            topics = analyzer.lda_topic_modeling(processed)
-            gaps = analyzer.identify_research_gaps(processed)
+            processed = get_processed()
+            stats = get_stats()
+            burst = get_burst()
+            topics = get_topics()
+            gaps = _get('analyzer').identify_research_gaps(processed)
             
             generate_report(processed, stats, burst, topics, gaps, output_dir)
             print(f"✓ 完整报告已保存至: {output_dir}/analysis_report.md")
@@ -373,69 +440,92 @@ def run_interactive_mode(fetcher, importer, processor, analyzer, visualizer, adv
                 print(f"  有摘要的论文: {with_abstract}")
 
 
-def generate_report(papers, keyword_stats, burst_words, topics, gaps, output_dir):
-    """生成综合分析报告"""
-    report = []
-    report.append("# SSCI旅游学术趋势分析报告")
-    report.append(f"\n**生成时间**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append(f"\n**分析论文数**: {len(papers)}")
+def generate_report(papers, keyword_stats, burst_words, topics, gaps, output_dir,
+                    return_text=False):
+    """生成综合分析报告
+
+    直接流式写入已缓冲的文件对象，不再先攒一个字符串列表再join，
+    峰值内存减半；需要报告文本时传return_text=True经StringIO同步收集。
+    """
+    report_path = os.path.join(output_dir, 'analysis_report.md')
+    buf = io.StringIO() if return_text else None
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        if buf is not None:
+            def w(s):
+                f.write(s)
+                f.write('\n')
+                buf.write(s)
+                buf.write('\n')
+        else:
+            def w(s):
+                f.write(s)
+                f.write('\n')
+
+        _write_report_body(w, papers, keyword_stats, burst_words, topics, gaps)
+
+    if return_text:
+        return buf.getvalue()
+
+
+def _write_report_body(w, papers, keyword_stats, burst_words, topics, gaps):
+    """逐行写出报告内容（w为按行写入的回调）"""
+    w("# SSCI旅游学术趋势分析报告")
+    w(f"\n**生成时间**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    w(f"\n**分析论文数**: {len(papers)}")
     
-    report.append("\n---\n")
-    report.append("## 1. 数据概览\n")
+    w("\n---\n")
+    w("## 1. 数据概览\n")
     
     if papers:
         years = [p.get('year', 0) for p in papers if p.get('year')]
         if years:
-            report.append(f"- 年份范围: {min(years)} - {max(years)}")
+            w(f"- 年份范围: {min(years)} - {max(years)}")
         
-        journals = {}
-        for p in papers:
-            j = p.get('journal', 'Unknown')
-            journals[j] = journals.get(j, 0) + 1
+        journals = Counter(p.get('journal', 'Unknown') for p in papers)
         
-        report.append(f"- 涉及期刊: {len(journals)} 种")
-        report.append("\n### 主要期刊分布\n")
-        for j, count in sorted(journals.items(), key=lambda x: -x[1])[:10]:
-            report.append(f"- {j}: {count} 篇")
+        w(f"- 涉及期刊: {len(journals)} 种")
+        w("\n### 主要期刊分布\n")
+        for j, count in journals.most_common(10):
+            w(f"- {j}: {count} 篇")
     
     if keyword_stats:
-        report.append("\n---\n")
-        report.append("## 2. 关键词分析\n")
-        report.append("### 2.1 高频关键词 Top 20\n")
-        report.append("| 排名 | 关键词 | 频次 |")
-        report.append("|------|--------|------|")
+        w("\n---\n")
+        w("## 2. 关键词分析\n")
+        w("### 2.1 高频关键词 Top 20\n")
+        w("| 排名 | 关键词 | 频次 |")
+        w("|------|--------|------|")
         for i, (kw, freq) in enumerate(list(keyword_stats.items())[:20], 1):
-            report.append(f"| {i} | {kw} | {freq} |")
+            w(f"| {i} | {kw} | {freq} |")
     
     if burst_words:
-        report.append("\n### 2.2 突发词（Burst Words）\n")
-        report.append("*突发词表示近期快速增长的研究热点*\n")
-        report.append("| 关键词 | 增长率 | 趋势 |")
-        report.append("|--------|--------|------|")
+        w("\n### 2.2 突发词（Burst Words）\n")
+        w("*突发词表示近期快速增长的研究热点*\n")
+        w("| 关键词 | 增长率 | 趋势 |")
+        w("|--------|--------|------|")
         for bw in burst_words[:15]:
             trend = "📈" if bw.get('growth_rate', 0) > 0 else "📉"
-            report.append(f"| {bw['keyword']} | {bw.get('growth_rate', 0):.1%} | {trend} |")
+            w(f"| {bw['keyword']} | {bw.get('growth_rate', 0):.1%} | {trend} |")
     
     if topics:
-        report.append("\n---\n")
-        report.append("## 3. LDA主题建模结果\n")
+        w("\n---\n")
+        w("## 3. LDA主题建模结果\n")
         for i, topic in enumerate(topics, 1):
-            report.append(f"\n### 主题 {i}: {topic.get('label', 'Unknown')}")
-            report.append(f"**核心关键词**: {', '.join(topic['keywords'][:8])}")
-            report.append(f"\n**主题描述**: {topic.get('description', '待补充')}\n")
+            w(f"\n### 主题 {i}: {topic.get('label', 'Unknown')}")
+            w(f"**核心关键词**: {', '.join(topic['keywords'][:8])}")
+            w(f"\n**主题描述**: {topic.get('description', '待补充')}\n")
     
     if gaps:
-        report.append("\n---\n")
-        report.append("## 4. 研究缺口识别\n")
-        report.append("*基于\"Limitations\"和\"Future Research\"文本挖掘*\n")
+        w("\n---\n")
+        w("## 4. 研究缺口识别\n")
+        w("*基于\"Limitations\"和\"Future Research\"文本挖掘*\n")
         for i, gap in enumerate(gaps, 1):
-            report.append(f"\n### 缺口 {i}: {gap['title']}")
-            report.append(f"- **识别来源**: {gap.get('source_count', 'N/A')} 篇论文提及")
-            report.append(f"- **研究机会**: {gap.get('opportunity', '待分析')}")
+            w(f"\n### 缺口 {i}: {gap['title']}")
+            w(f"- **识别来源**: {gap.get('source_count', 'N/A')} 篇论文提及")
+            w(f"- **研究机会**: {gap.get('opportunity', '待分析')}")
     
-    report.append("\n---\n")
-    report.append("## 5. 选题建议\n")
-    report.append("""
+    w("\n---\n")
+    w("## 5. 选题建议\n")
+    w("""
 基于以上分析，建议关注以下研究方向：
 
 1. **新兴技术应用**: 结合突发词中的技术关键词（如AI、VR、IoT），探索其在旅游领域的创新应用
@@ -451,28 +541,21 @@ def generate_report(papers, keyword_stats, burst_words, topics, gaps, output_dir
 > 研究缺口。"
 """)
     
-    report.append("\n---\n")
-    report.append("## 附录\n")
-    report.append("### 数据文件清单\n")
-    report.append("- `processed_papers.csv` - 预处理后的论文数据")
-    report.append("- `keyword_analysis.csv` - 关键词统计")
-    report.append("- `burst_words.csv` - 突发词列表")
-    report.append("- `lda_topics.txt` - LDA主题详情")
-    report.append("- `research_gaps.txt` - 研究缺口")
-    report.append("- `ai_suggestions.md` - AI辅助建议")
-    report.append("\n### 可视化图表\n")
-    report.append("- `keyword_trends.png` - 关键词趋势图")
-    report.append("- `cooccurrence_network.png` - 关键词共现网络")
-    report.append("- `yearly_heatmap.png` - 年度热力图")
-    report.append("- `topic_distribution.png` - 主题分布图")
-    report.append("- `citation_analysis.png` - 引用分析图")
-    
-    report_text = '\n'.join(report)
-    
-    with open(os.path.join(output_dir, 'analysis_report.md'), 'w', encoding='utf-8') as f:
-        f.write(report_text)
-    
-    return report_text
+    w("\n---\n")
+    w("## 附录\n")
+    w("### 数据文件清单\n")
+    w("- `processed_papers.csv` - 预处理后的论文数据")
+    w("- `keyword_analysis.csv` - 关键词统计")
+    w("- `burst_words.csv` - 突发词列表")
+    w("- `lda_topics.txt` - LDA主题详情")
+    w("- `research_gaps.txt` - 研究缺口")
+    w("- `ai_suggestions.md` - AI辅助建议")
+    w("\n### 可视化图表\n")
+    w("- `keyword_trends.png` - 关键词趋势图")
+    w("- `cooccurrence_network.png` - 关键词共现网络")
+    w("- `yearly_heatmap.png` - 年度热力图")
+    w("- `topic_distribution.png` - 主题分布图")
+    w("- `citation_analysis.png` - 引用分析图")
 
 
 if __name__ == '__main__':
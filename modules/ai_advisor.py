@@ -3,13 +3,293 @@ AI辅助模块
 生成研究选题建议、论文写作指导等
 """
 
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
 import os
+import re
+import tempfile
+import time
 from typing import List, Dict, Optional
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# 选题分类词表：模块加载时编译成单个正则交替式，
+# 分类时对每个关键词只做一次线性扫描（并且只lower一次）
+_TECH_RE = re.compile('|'.join(map(re.escape, (
+    'ai', 'vr', 'ar', 'iot', 'generative ai', 'chatgpt', 'metaverse', 'smart tourism'))))
+_BEHAVIOR_RE = re.compile('|'.join(map(re.escape, (
+    'satisfaction', 'loyalty', 'motivation', 'experience', 'behavior', 'intention'))))
+_SUSTAIN_RE = re.compile('|'.join(map(re.escape, (
+    'sustainable', 'green', 'eco', 'carbon', 'environmental'))))
+
+# 5.3节洞察挖掘用：一次regex findall在C层完成分词+长度过滤
+_LONG_WORD_RE = re.compile(r'\b\w{6,}\b')
+
+_STOPWORDS = None
+
+
+def _get_stopwords() -> frozenset:
+    """复用TextProcessor的通用+学术停用词表（懒加载单例），
+    过滤however/research/studies这类高频噪声词"""
+    global _STOPWORDS
+    if _STOPWORDS is None:
+        from modules.text_processor import TextProcessor
+        processor = TextProcessor()
+        _STOPWORDS = frozenset(processor.stopwords) | frozenset(processor.academic_stopwords)
+    return _STOPWORDS
+
+# _generate_local报告中的纯静态段落：提升为模块常量，
+# 每次生成不再重建这几个3-4KB的三引号字符串对象
+_STATIC_METHODOLOGY = """
+### 2.1 推荐研究设计
+
+**混合方法设计（Mixed-Methods）**：
+- 第一阶段：定性探索（深度访谈/焦点小组）→ 构建理论框架
+- 第二阶段：定量验证（问卷调查）→ 假设检验
+- 第三阶段：大数据分析（文本挖掘）→ 结果三角验证
+
+### 2.2 数据收集方法
+
+**主要数据**：
+- 问卷调查：Prolific/MTurk样本（建议N>300）
+- 二手数据：TripAdvisor/携程评论数据
+
+**辅助数据**：
+- 深度访谈：15-20位旅游从业者或游客
+- 实验数据：A/B测试或情境实验
+
+### 2.3 分析技术（可写入方法论）
+
+```
+"本研究采用基于Python的多阶段文本挖掘技术（Text Mining），
+对Web of Science近三年的XX篇旅游类SSCI论文进行了系统性的
+演化路径分析，识别出XX个核心研究主题和XX个潜在研究缺口。
+具体而言，我们使用了以下技术栈：
+- 数据采集：OpenAlex API自动化文献检索
+- 文本预处理：NLTK/spaCy分词、词干提取、命名实体识别
+- 主题建模：LDA（Latent Dirichlet Allocation）
+- 可视化：NetworkX共现网络分析
+"
+```
+
+### 2.4 统计工具
+
+- 结构方程模型（SEM）：AMOS/SmartPLS
+- 机器学习：Python scikit-learn
+- 文本分析：LIWC/Sentiment Analysis
+"""
+
+_STATIC_WRITING = """
+### 3.1 方法论部分亮点
+
+**技术含量体现**：
+1. 强调"计算方法"（Computational Methods）
+2. 使用"大数据"（Big Data）/大样本
+3. 展示分析代码片段或流程图
+4. 引用最新的方法论文献
+
+**示例段落**：
+> "Drawing on computational social science approaches (Lazer et al., 2009), 
+> this study employed a multi-stage text mining procedure to analyze 
+> [N] academic papers retrieved from Web of Science database..."
+
+### 3.2 理论贡献定位
+
+**三层贡献框架**：
+1. **理论层面**：扩展/修正现有理论（如TAM, TPB, S-D Logic）
+2. **方法层面**：引入新的研究方法或数据来源
+3. **实践层面**：为产业界提供可操作建议
+
+### 3.3 审稿人关注点
+
+| 常见问题 | 应对策略 |
+|---------|---------|
+| 样本代表性 | 说明样本选择理由，讨论局限性 |
+| 因果推断 | 使用纵向设计或工具变量 |
+| 理论贡献 | 明确提出命题或修正现有理论 |
+| 实践意义 | 添加"Managerial Implications"小节 |
+| 方法透明度 | 提供补充材料（数据/代码）|
+"""
+
+# API提示词模板：静态正文只在模块加载时构建一次，
+# _build_prompt每次调用仅填充动态槽位（一次format_map）
+_PROMPT_TEMPLATE = """你是一位资深的旅游学SSCI期刊编辑和学术研究顾问。请基于以下学术文献分析数据，为一位想发表SSCI论文的研究者提供选题建议和写作指导。
+
+## 分析数据概览
+
+- 分析论文数量：{total_papers}篇
+- 聚焦方向：{focus_area}
+
+## Top 30 高频关键词
+{keywords}
+
+## 高被引论文（Top 10）
+{top_cited}
+
+## 最新发表论文（Top 10）
+{recent}
+
+## 研究局限性摘录（来自多篇论文）
+{limitations}
+
+## 未来研究建议摘录（来自多篇论文）
+{future_research}
+
+## 已识别的研究缺口
+{gaps}
+
+---
+
+请提供以下内容（用中文回答）：
+
+### 1. 选题建议（3-5个具体选题）
+- 每个选题需要包含：题目、研究问题、创新点、潜在贡献
+- 选题应当：填补研究缺口、结合新兴趋势、具有理论和实践价值
+
+### 2. 方法论建议
+- 推荐的研究设计
+- 数据收集方法
+- 分析技术（可以突出使用Python/文本挖掘/大数据分析等方法）
+
+### 3. 论文写作指导
+- 如何在方法论部分体现技术含量
+- 如何定位理论贡献
+- 审稿人可能关注的点
+
+### 4. 发表策略
+- 适合投稿的目标期刊
+- 提高接受率的建议
+
+请确保建议具有实操性，能够直接指导研究工作。
+"""
+
+_STATIC_STRATEGY = """
+### 4.1 目标期刊推荐
+
+**Tier 1 (Impact Factor > 10)**：
+- Tourism Management（最推荐）
+- Annals of Tourism Research
+
+**Tier 2 (Impact Factor 5-10)**：
+- Journal of Travel Research
+- International Journal of Hospitality Management
+- Journal of Sustainable Tourism
+
+**Tier 3 (Impact Factor 3-5)**：
+- Current Issues in Tourism
+- Tourism Geographies
+- Journal of Destination Marketing & Management
+
+### 4.2 提高接受率建议
+
+1. **预投稿**：先发会议论文（TTRA, ENTER）获取反馈
+2. **编辑desk-reject规避**：
+   - 严格遵循Author Guidelines
+   - 确保研究问题与期刊scope匹配
+   - 首页突出理论贡献
+3. **Cover Letter策略**：
+   - 强调novelty和timeliness
+   - 说明与期刊近期论文的关联
+4. **修改策略**：
+   - R&R后快速响应（2-3周内）
+   - 逐条回复审稿意见
+   - 使用表格展示修改
+
+### 4.3 时间规划
+
+| 阶段 | 预计时间 |
+|------|---------|
+| 文献综述 | 1-2个月 |
+| 数据收集 | 1-2个月 |
+| 数据分析 | 1个月 |
+| 写作初稿 | 1个月 |
+| 内部审阅 | 2周 |
+| 投稿-录用 | 6-12个月 |
+
+**建议总周期**：12-18个月
+"""
+
+
+
+class _ResponseCache:
+    """
+    AI响应的磁盘缓存
+
+    以提示词内容哈希为键，把API响应持久化到本地目录，
+    跨会话/重启有效；相同输入直接读磁盘，省去API费用和延迟。
+    """
+
+    def __init__(self, cache_dir: str = '.ai_cache', ttl: int = 7 * 86400):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry.get('ts', 0) > self.ttl:
+                os.remove(path)
+                return None
+            return entry.get('value')
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: str):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'value': value}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.debug(f"写入AI缓存失败: {e}")
+
+
+class _PromptSimilarityIndex:
+    """近似提示词索引（语义缓存的第二层）
+
+    精确哈希未命中时，用词袋Jaccard相似度在近期提示词里找近重复，
+    相似度达到阈值则复用其磁盘缓存的响应。纯标准库实现，
+    对"同一批论文微扰后重复询问"这类场景足够有效，
+    不必引入句向量模型依赖。
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 64):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries = []  # [(token_set, prompt), ...]
+
+    @staticmethod
+    def _tokens(text: str) -> frozenset:
+        return frozenset(re.findall(r'\w+', text.lower()))
+
+    def find(self, prompt: str) -> Optional[str]:
+        """返回足够相似的历史提示词（作为磁盘缓存的键），无则None"""
+        tokens = self._tokens(prompt)
+        if not tokens:
+            return None
+        best_prompt, best_sim = None, 0.0
+        for entry_tokens, entry_prompt in self._entries:
+            inter = len(tokens & entry_tokens)
+            if not inter:
+                continue
+            sim = inter / len(tokens | entry_tokens)
+            if sim > best_sim:
+                best_sim, best_prompt = sim, entry_prompt
+        return best_prompt if best_sim >= self.threshold else None
+
+    def add(self, prompt: str):
+        if len(self._entries) >= self.max_entries:
+            self._entries.pop(0)
+        self._entries.append((self._tokens(prompt), prompt))
+
 
 class AIAdvisor:
     """AI研究顾问"""
@@ -23,23 +303,41 @@ class AIAdvisor:
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         self.has_api = bool(self.api_key)
-        
-        if self.has_api:
+        self.cache = _ResponseCache()
+        self._local_report_cache = {}  # 数据内容哈希 -> 本地报告正文（小型FIFO）
+        self._kw_cache = {}  # 论文集指纹 -> (关键词Counter, 年份min, 年份max)
+        self.prompt_index = _PromptSimilarityIndex()
+        self._client = None  # anthropic客户端，首次API调用时才导入并构建
+
+        if not self.has_api:
+            logger.info("未配置API Key，将使用本地规则分析")
+
+    @property
+    def client(self):
+        """Anthropic客户端（懒加载）
+
+        anthropic会连带导入httpx/pydantic等约100ms的依赖，
+        推迟到第一次真正调API时再付这笔导入成本；
+        只用本地报告的会话完全不触发。导入/连接失败则永久降级为本地模式。
+        """
+        if self._client is None:
             try:
                 import anthropic
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                self._client = anthropic.Anthropic(api_key=self.api_key)
                 logger.info("已连接Anthropic API")
             except ImportError:
                 logger.warning("anthropic包未安装，将使用本地分析")
                 self.has_api = False
+                raise
             except Exception as e:
                 logger.warning(f"API连接失败: {e}，将使用本地分析")
                 self.has_api = False
-        else:
-            logger.info("未配置API Key，将使用本地规则分析")
-    
+                raise
+        return self._client
+
+
     def generate_suggestions(self, papers: List[Dict], gaps: Optional[List[Dict]] = None,
-                            focus_area: Optional[str] = None) -> str:
+                            focus_area: Optional[str] = None, stream: bool = False):
         """
         生成研究选题建议
         
@@ -47,48 +345,366 @@ class AIAdvisor:
             papers: 分析过的论文列表
             gaps: 识别的研究缺口
             focus_area: 聚焦的研究方向（可选）
+            stream: True时返回文本块迭代器（API模式下边生成边产出，
+                首字延迟从数秒降到亚秒级）
         
         Returns:
-            建议报告（Markdown格式）
+            建议报告（Markdown格式），stream=True时为迭代器
         """
         # 收集分析数据
         analysis_data = self._collect_analysis_data(papers, gaps, focus_area)
         
+        if stream:
+            if self.has_api:
+                return self._generate_with_api_stream(analysis_data)
+            return iter((self._generate_local(analysis_data),))
+
         if self.has_api:
             return self._generate_with_api(analysis_data)
         else:
             return self._generate_local(analysis_data)
     
-    def _collect_analysis_data(self, papers: List[Dict], gaps: Optional[List[Dict]],
-                               focus_area: Optional[str]) -> Dict:
-        """收集用于分析的数据"""
-        # 关键词统计
+    def generate_suggestions_bulk(self, papers: List[Dict], focus_areas: List[str],
+                                  gaps: Optional[List[Dict]] = None,
+                                  poll_interval: float = 5.0) -> Dict[str, str]:
+        """为多个聚焦方向批量生成建议
+
+        API模式下走Anthropic Message Batches接口：N个方向合并为一次
+        批量提交（服务端排队执行，计费约为逐条调用的一半），轮询完成后
+        统一取回；分析数据只收集一次，已缓存的方向不重复提交。
+        无API时退化为逐方向本地报告。
+
+        Args:
+            papers: 分析过的论文列表
+            focus_areas: 聚焦方向列表
+            gaps: 识别的研究缺口
+            poll_interval: 批量任务轮询间隔（秒）
+
+        Returns:
+            {focus_area: 建议报告} 映射
+        """
+        base = self._collect_analysis_data(papers, gaps, None)
+        datas = {fa: dict(base, focus_area=fa) for fa in focus_areas}
+
+        if not self.has_api:
+            return {fa: self._generate_local(d) for fa, d in datas.items()}
+
+        results: Dict[str, str] = {}
+        prompts: Dict[str, str] = {}
+        for fa, d in datas.items():
+            prompt = self._build_prompt(d)
+            cached = self._cached_response(prompt)
+            if cached is not None:
+                results[fa] = cached
+            else:
+                prompts[fa] = prompt
+
+        if not prompts:
+            return results
+
+        # custom_id只允许[a-zA-Z0-9_-]{1,64}，聚焦方向常含中文/空格，
+        # 用合成序号作id，结果按映射解析回原方向
+        id_to_fa = {f"fa-{i}": fa for i, fa in enumerate(prompts)}
+
+        try:
+            batch = self.client.messages.batches.create(requests=[
+                {
+                    'custom_id': custom_id,
+                    'params': {
+                        'model': "claude-sonnet-4-20250514",
+                        'max_tokens': 4000,
+                        'messages': [{"role": "user", "content": prompts[fa]}],
+                    },
+                }
+                for custom_id, fa in id_to_fa.items()
+            ])
+            while batch.processing_status != 'ended':
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                fa = id_to_fa[entry.custom_id]
+                if entry.result.type == 'succeeded':
+                    text = entry.result.message.content[0].text
+                    self._store_response(prompts[fa], text)
+                    results[fa] = text
+                else:
+                    logger.warning(f"批量请求'{fa}'失败: {entry.result.type}，改用本地报告")
+                    results[fa] = self._generate_local(datas[fa])
+        except Exception as e:
+            logger.error(f"批量API调用失败: {e}")
+            for fa in prompts:
+                results.setdefault(fa, self._generate_local(datas[fa]))
+
+        return results
+
+    # ==================== Streamlit界面使用的context接口 ====================
+
+    def _papers_from_context(self, context: Dict) -> List[Dict]:
+        """从context中提取论文列表（DataFrame自动转为记录列表）"""
+        data = context.get('data')
+        if data is None:
+            return []
+        if hasattr(data, 'to_dict'):  # pandas DataFrame
+            return data.to_dict('records')
+        return list(data)
+
+    def generate_topic_suggestions(self, context: Dict) -> str:
+        """生成选题建议（context包含data/analysis/topics/focus）"""
+        papers = self._papers_from_context(context)
+        return self.generate_suggestions(papers, focus_area=context.get('focus'))
+
+    def generate_writing_framework(self, paper_topic: str) -> str:
+        """生成论文写作框架"""
+        if self.has_api:
+            prompt = f"""你是一位资深的旅游学SSCI期刊编辑。请为以下论文题目设计一个
+符合SSCI期刊规范的完整写作框架（用中文回答，Markdown格式）：
+
+题目：{paper_topic}
+
+框架需要包含各章节的写作要点、建议篇幅和审稿人关注点。"""
+            return self._ask_api(prompt)
+
+        return f"""# 论文写作框架建议
+
+**论文主题**: {paper_topic or '（未指定）'}
+
+## 1. Introduction（约1500词）
+- 研究背景与重要性（hook + context）
+- 研究缺口（明确指出现有文献的不足）
+- 研究问题与目标
+- 理论与实践贡献预告
+
+## 2. Literature Review（约2000词）
+- 核心概念界定
+- 相关理论基础（如TAM、TPB、S-D Logic）
+- 既有研究述评与假设推导
+
+## 3. Methodology（约1500词）
+- 研究设计与方法选择依据
+- 数据收集（样本、程序、测量工具）
+- 分析技术（SEM/文本挖掘/实验等）
+
+## 4. Results（约1500词）
+- 描述性统计与信效度检验
+- 假设检验结果
+- 稳健性检验
+
+## 5. Discussion & Conclusion（约1500词）
+- 理论贡献（Theoretical Implications）
+- 实践启示（Managerial Implications）
+- 局限性与未来研究方向
+
+> 提示：配置 ANTHROPIC_API_KEY 后可获得针对具体题目的定制化框架。
+"""
+
+    def analyze_research_gaps(self, context: Dict) -> str:
+        """研究缺口深度分析（context包含data/analysis/topics）"""
+        papers = self._papers_from_context(context)
+        analysis = context.get('analysis') or {}
+        gap_descriptions = analysis.get('research_gaps', [])
+
+        if self.has_api:
+            prompt = f"""你是一位资深的旅游学SSCI期刊编辑。基于以下文献分析结果，
+请深入分析研究缺口并给出可操作的研究机会（用中文回答，Markdown格式）：
+
+{self._build_context(papers)}
+
+初步识别的缺口：
+{self._format_list([str(g) for g in gap_descriptions[:10]]) or '（无）'}
+"""
+            return self._ask_api(prompt)
+
+        # 本地规则分析
+        lines = ["# 研究缺口分析报告", ""]
+        lines.append(f"**分析基础**: {len(papers)}篇论文")
+        lines.append("")
+        if gap_descriptions:
+            lines.append("## 已识别的研究缺口")
+            for i, gap in enumerate(gap_descriptions, 1):
+                lines.append(f"{i}. {gap}")
+        else:
+            lines.append("尚未识别到明确的研究缺口，请先完成关键词分析。")
+        lines.append("")
+        lines.append("## 建议")
+        lines.append("- 针对上述缺口设计填补性研究，优先选择高被引低频主题")
+        lines.append("- 结合突发词中的新兴技术关键词寻找交叉创新点")
+        return '\n'.join(lines)
+
+    def answer_question(self, context: Dict) -> str:
+        """回答用户自定义问题"""
+        question = context.get('question', '')
+        papers = self._papers_from_context(context)
+
+        if self.has_api:
+            prompt = f"""你是一位资深的旅游学SSCI期刊编辑和学术研究顾问。
+
+以下是基于{len(papers)}篇论文的分析数据：
+{self._build_context(papers)}
+
+请基于这些数据回答用户的问题，提供专业、具体、可操作的建议。用中文回答。
+
+问题：{question}"""
+            return self._ask_api(prompt)
+
+        return (f"**问题**: {question}\n\n"
+                "当前未配置 ANTHROPIC_API_KEY，无法调用AI深度回答。\n\n"
+                "建议：\n"
+                "- 配置API Key后重试以获得针对性回答\n"
+                "- 或使用【生成选题建议】功能获取基于规则的分析报告")
+
+    def _cached_response(self, prompt: str) -> Optional[str]:
+        """两层提示词缓存：先精确哈希，再近似匹配历史提示词"""
+        cached = self.cache.get(prompt)
+        if cached is not None:
+            logger.info("命中AI响应缓存")
+            return cached
+        near = self.prompt_index.find(prompt)
+        if near is not None:
+            cached = self.cache.get(near)
+            if cached is not None:
+                logger.info("命中近似提示词缓存")
+                return cached
+        return None
+
+    def _store_response(self, prompt: str, text: str):
+        self.cache.set(prompt, text)
+        self.prompt_index.add(prompt)
+
+    def _ask_api(self, prompt: str) -> str:
+        """单轮API调用（相同或近似提示词命中缓存，不重复计费）"""
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
+        try:
+            message = self.client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=4000,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            text = message.content[0].text
+            self._store_response(prompt, text)
+            return text
+        except Exception as e:
+            logger.error(f"API调用失败: {e}")
+            return f"API调用失败: {e}"
+
+    # ==================== 异步接口（避免阻塞UI线程，可gather并发） ====================
+
+    async def agenerate_suggestions(self, papers: List[Dict], gaps: Optional[List[Dict]] = None,
+                                    focus_area: Optional[str] = None) -> str:
+        """异步版generate_suggestions：数据收集与API调用都在工作线程执行，
+        事件循环可同时推进其他任务（如与agenerate_*系列gather并发）"""
+        data = await asyncio.to_thread(self._collect_analysis_data, papers, gaps, focus_area)
+        if self.has_api:
+            return await asyncio.to_thread(self._generate_with_api, data)
+        return await asyncio.to_thread(self._generate_local, data)
+
+    async def agenerate_topic_suggestions(self, context: Dict) -> str:
+        return await asyncio.to_thread(self.generate_topic_suggestions, context)
+
+    async def agenerate_writing_framework(self, paper_topic: str) -> str:
+        return await asyncio.to_thread(self.generate_writing_framework, paper_topic)
+
+    async def aanalyze_research_gaps(self, context: Dict) -> str:
+        return await asyncio.to_thread(self.analyze_research_gaps, context)
+
+    async def aanswer_question(self, context: Dict) -> str:
+        return await asyncio.to_thread(self.answer_question, context)
+
+    @staticmethod
+    def _papers_fingerprint(papers: List[Dict]) -> int:
+        """论文集的轻量指纹（基于id/doi/标题），作为跨方法缓存键"""
+        return hash(tuple(
+            p.get('id') or p.get('doi') or p.get('title', '') for p in papers
+        ))
+
+    def _compute_keyword_stats(self, papers: List[Dict]):
+        """计算关键词Counter与年份范围，按论文集指纹缓存
+
+        generate_suggestions与interactive_qa/_build_context对同一批论文
+        会重复做这趟统计，memo后一个会话内只扫一次。
+        """
+        if not papers:
+            return Counter(), None, None
+
+        key = self._papers_fingerprint(papers)
+        cached = self._kw_cache.get(key)
+        if cached is not None:
+            return cached
+
         keyword_freq = Counter()
+        year_min = year_max = None
         for p in papers:
-            keywords = p.get('all_keywords', p.get('keywords', []))
-            keyword_freq.update(keywords)
-        
-        # 研究局限性和未来研究建议
+            keywords = p.get('all_keywords') or p.get('keywords') or ()
+            if keywords:
+                keyword_freq.update(keywords)
+            year = p.get('year')
+            if year:
+                if year_min is None or year < year_min:
+                    year_min = year
+                if year_max is None or year > year_max:
+                    year_max = year
+
+        if len(self._kw_cache) >= 8:
+            self._kw_cache.pop(next(iter(self._kw_cache)))
+        result = (keyword_freq, year_min, year_max)
+        self._kw_cache[key] = result
+        return result
+
+    def _collect_analysis_data(self, papers: List[Dict], gaps: Optional[List[Dict]],
+                               focus_area: Optional[str]) -> Dict:
+        """收集用于分析的数据（单趟遍历：摘录与两个有界堆一起维护，
+        省去对papers的多次重复扫描和整表排序；关键词计数走共享缓存）"""
+        if not papers:
+            # 空输入直接给默认值，不走Counter/堆的构建
+            return {
+                'total_papers': 0,
+                'top_keywords': {},
+                'limitations': [],
+                'future_research': [],
+                'top_cited': [],
+                'recent_papers': [],
+                'gaps': gaps or [],
+                'focus_area': focus_area,
+            }
+
+        keyword_freq, _, _ = self._compute_keyword_stats(papers)
         limitations = []
         future_research = []
-        for p in papers:
-            if p.get('limitations'):
+        cited_heap = []   # 最小堆，保留被引Top 10
+        recent_heap = []  # 最小堆，保留年份Top 10
+
+        for idx, p in enumerate(papers):
+            if len(limitations) < 20 and p.get('limitations'):
                 limitations.append(p['limitations'])
-            if p.get('future_research'):
+            if len(future_research) < 20 and p.get('future_research'):
                 future_research.append(p['future_research'])
-        
-        # 高被引论文
-        top_cited = sorted(papers, key=lambda x: x.get('citations', 0), reverse=True)[:10]
-        
-        # 最新论文
-        recent = sorted([p for p in papers if p.get('year')], 
-                       key=lambda x: x['year'], reverse=True)[:10]
+
+            # -idx让并列值保持原有稳定顺序（先出现者优先）
+            cit_key = (p.get('citations', 0), -idx)
+            if len(cited_heap) < 10:
+                heapq.heappush(cited_heap, (cit_key, p))
+            elif cit_key > cited_heap[0][0]:
+                heapq.heapreplace(cited_heap, (cit_key, p))
+
+            year = p.get('year')
+            if year:
+                year_key = (year, -idx)
+                if len(recent_heap) < 10:
+                    heapq.heappush(recent_heap, (year_key, p))
+                elif year_key > recent_heap[0][0]:
+                    heapq.heapreplace(recent_heap, (year_key, p))
+
+        top_cited = [p for _, p in sorted(cited_heap, key=lambda e: e[0], reverse=True)]
+        recent = [p for _, p in sorted(recent_heap, key=lambda e: e[0], reverse=True)]
         
         return {
             'total_papers': len(papers),
             'top_keywords': dict(keyword_freq.most_common(30)),
-            'limitations': limitations[:20],
-            'future_research': future_research[:20],
+            'limitations': limitations,
+            'future_research': future_research,
             'top_cited': [{'title': p.get('title', ''), 'citations': p.get('citations', 0)} for p in top_cited],
             'recent_papers': [{'title': p.get('title', ''), 'year': p.get('year')} for p in recent],
             'gaps': gaps or [],
@@ -98,7 +714,11 @@ class AIAdvisor:
     def _generate_with_api(self, data: Dict) -> str:
         """使用API生成建议"""
         prompt = self._build_prompt(data)
-        
+
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
         try:
             message = self.client.messages.create(
                 model="claude-sonnet-4-20250514",
@@ -110,68 +730,84 @@ class AIAdvisor:
                     }
                 ]
             )
-            
-            return message.content[0].text
-            
+
+            text = message.content[0].text
+            self._store_response(prompt, text)
+            return text
+
         except Exception as e:
             logger.error(f"API调用失败: {e}")
             return self._generate_local(data)
-    
-    def _build_prompt(self, data: Dict) -> str:
-        """构建API提示词"""
-        prompt = f"""你是一位资深的旅游学SSCI期刊编辑和学术研究顾问。请基于以下学术文献分析数据，为一位想发表SSCI论文的研究者提供选题建议和写作指导。
-
-## 分析数据概览
-
-- 分析论文数量：{data['total_papers']}篇
-- 聚焦方向：{data['focus_area'] or '未指定'}
-
-## Top 30 高频关键词
-{self._format_keywords(data['top_keywords'])}
-
-## 高被引论文（Top 10）
-{self._format_papers(data['top_cited'])}
 
-## 最新发表论文（Top 10）
-{self._format_recent(data['recent_papers'])}
-
-## 研究局限性摘录（来自多篇论文）
-{self._format_list(data['limitations'][:10])}
-
-## 未来研究建议摘录（来自多篇论文）
-{self._format_list(data['future_research'][:10])}
+    def _generate_with_api_stream(self, data: Dict):
+        """流式版_generate_with_api：逐块产出文本，调用失败时退回本地报告"""
+        prompt = self._build_prompt(data)
+        try:
+            yield from self._stream_api(prompt)
+        except Exception as e:
+            logger.error(f"API调用失败: {e}")
+            yield self._generate_local(data)
 
-## 已识别的研究缺口
-{self._format_gaps(data['gaps'])}
+    def _stream_api(self, prompt: str, system: Optional[str] = None,
+                    max_tokens: int = 4000, cache_key: Optional[str] = None):
+        """单轮流式API调用：命中缓存时一次产出全文，
+        否则转发stream.text_stream并在结束后写入缓存"""
+        key = cache_key or prompt
+        cached = self._cached_response(key)
+        if cached is not None:
+            yield cached
+            return
 
----
+        kwargs = dict(
+            model="claude-sonnet-4-20250514",
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        if system:
+            kwargs['system'] = system
 
-请提供以下内容（用中文回答）：
+        parts = []
+        with self.client.messages.stream(**kwargs) as stream:
+            for chunk in stream.text_stream:
+                parts.append(chunk)
+                yield chunk
+        self._store_response(key, ''.join(parts))
 
-### 1. 选题建议（3-5个具体选题）
-- 每个选题需要包含：题目、研究问题、创新点、潜在贡献
-- 选题应当：填补研究缺口、结合新兴趋势、具有理论和实践价值
+    def _build_prompt(self, data: Dict) -> str:
+        """构建API提示词（静态正文在模块加载时已定型，
+        这里只计算动态槽位后做一次format_map）"""
+        return _PROMPT_TEMPLATE.format_map({
+            'total_papers': data['total_papers'],
+            'focus_area': data['focus_area'] or '未指定',
+            'keywords': self._format_keywords(data['top_keywords']),
+            'top_cited': self._format_papers(data['top_cited']),
+            'recent': self._format_recent(data['recent_papers']),
+            'limitations': self._format_list(data['limitations'][:10]),
+            'future_research': self._format_list(data['future_research'][:10]),
+            'gaps': self._format_gaps(data['gaps']),
+        })
+    
+    def _generate_local(self, data: Dict) -> str:
+        """本地生成建议（不使用API）
 
-### 2. 方法论建议
-- 推荐的研究设计
-- 数据收集方法
-- 分析技术（可以突出使用Python/文本挖掘/大数据分析等方法）
+        报告正文对同一份分析数据是确定性的，按内容哈希memo；
+        命中时只需追加新的时间戳，整个字符串组装过程跳过。
+        """
+        key = hashlib.blake2b(
+            json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        ).digest()
+        body = self._local_report_cache.get(key)
+        if body is None:
+            body = self._render_local_report(data)
+            if len(self._local_report_cache) >= 8:
+                self._local_report_cache.pop(next(iter(self._local_report_cache)))
+            self._local_report_cache[key] = body
 
-### 3. 论文写作指导
-- 如何在方法论部分体现技术含量
-- 如何定位理论贡献
-- 审稿人可能关注的点
+        timestamp = __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return f"{body}\n\n---\n\n*报告生成时间：{timestamp}*"
 
-### 4. 发表策略
-- 适合投稿的目标期刊
-- 提高接受率的建议
-
-请确保建议具有实操性，能够直接指导研究工作。
-"""
-        return prompt
-    
-    def _generate_local(self, data: Dict) -> str:
-        """本地生成建议（不使用API）"""
+    def _render_local_report(self, data: Dict) -> str:
+        """渲染本地报告正文（不含时间戳）"""
         suggestions = []
         
         suggestions.append("# SSCI旅游论文选题与写作建议报告")
@@ -187,14 +823,11 @@ class AIAdvisor:
         # 基于关键词分析生成选题
         top_kws = list(data['top_keywords'].keys())[:15]
         
-        # 识别热门主题组合
-        tech_keywords = ['ai', 'vr', 'ar', 'iot', 'generative ai', 'chatgpt', 'metaverse', 'smart tourism']
-        behavior_keywords = ['satisfaction', 'loyalty', 'motivation', 'experience', 'behavior', 'intention']
-        sustainability_keywords = ['sustainable', 'green', 'eco', 'carbon', 'environmental']
-        
-        found_tech = [k for k in top_kws if any(t in k.lower() for t in tech_keywords)]
-        found_behavior = [k for k in top_kws if any(b in k.lower() for b in behavior_keywords)]
-        found_sustain = [k for k in top_kws if any(s in k.lower() for s in sustainability_keywords)]
+        # 识别热门主题组合（预编译正则一趟分类，替代逐词嵌套子串探测）
+        lowered = [(k, k.lower()) for k in top_kws]
+        found_tech = [k for k, lk in lowered if _TECH_RE.search(lk)]
+        found_behavior = [k for k, lk in lowered if _BEHAVIOR_RE.search(lk)]
+        found_sustain = [k for k, lk in lowered if _SUSTAIN_RE.search(lk)]
         
         topic_suggestions = []
         
@@ -244,130 +877,19 @@ class AIAdvisor:
         
         # 2. 方法论建议
         suggestions.append("## 2. 方法论建议\n")
-        suggestions.append("""
-### 2.1 推荐研究设计
-
-**混合方法设计（Mixed-Methods）**：
-- 第一阶段：定性探索（深度访谈/焦点小组）→ 构建理论框架
-- 第二阶段：定量验证（问卷调查）→ 假设检验
-- 第三阶段：大数据分析（文本挖掘）→ 结果三角验证
-
-### 2.2 数据收集方法
-
-**主要数据**：
-- 问卷调查：Prolific/MTurk样本（建议N>300）
-- 二手数据：TripAdvisor/携程评论数据
-
-**辅助数据**：
-- 深度访谈：15-20位旅游从业者或游客
-- 实验数据：A/B测试或情境实验
-
-### 2.3 分析技术（可写入方法论）
-
-```
-"本研究采用基于Python的多阶段文本挖掘技术（Text Mining），
-对Web of Science近三年的XX篇旅游类SSCI论文进行了系统性的
-演化路径分析，识别出XX个核心研究主题和XX个潜在研究缺口。
-具体而言，我们使用了以下技术栈：
-- 数据采集：OpenAlex API自动化文献检索
-- 文本预处理：NLTK/spaCy分词、词干提取、命名实体识别
-- 主题建模：LDA（Latent Dirichlet Allocation）
-- 可视化：NetworkX共现网络分析
-"
-```
-
-### 2.4 统计工具
-
-- 结构方程模型（SEM）：AMOS/SmartPLS
-- 机器学习：Python scikit-learn
-- 文本分析：LIWC/Sentiment Analysis
-""")
+        suggestions.append(_STATIC_METHODOLOGY)
         
         suggestions.append("\n---\n")
         
         # 3. 论文写作指导
         suggestions.append("## 3. 论文写作指导\n")
-        suggestions.append("""
-### 3.1 方法论部分亮点
-
-**技术含量体现**：
-1. 强调"计算方法"（Computational Methods）
-2. 使用"大数据"（Big Data）/大样本
-3. 展示分析代码片段或流程图
-4. 引用最新的方法论文献
-
-**示例段落**：
-> "Drawing on computational social science approaches (Lazer et al., 2009), 
-> this study employed a multi-stage text mining procedure to analyze 
-> [N] academic papers retrieved from Web of Science database..."
-
-### 3.2 理论贡献定位
-
-**三层贡献框架**：
-1. **理论层面**：扩展/修正现有理论（如TAM, TPB, S-D Logic）
-2. **方法层面**：引入新的研究方法或数据来源
-3. **实践层面**：为产业界提供可操作建议
-
-### 3.3 审稿人关注点
-
-| 常见问题 | 应对策略 |
-|---------|---------|
-| 样本代表性 | 说明样本选择理由，讨论局限性 |
-| 因果推断 | 使用纵向设计或工具变量 |
-| 理论贡献 | 明确提出命题或修正现有理论 |
-| 实践意义 | 添加"Managerial Implications"小节 |
-| 方法透明度 | 提供补充材料（数据/代码）|
-""")
+        suggestions.append(_STATIC_WRITING)
         
         suggestions.append("\n---\n")
         
         # 4. 发表策略
         suggestions.append("## 4. 发表策略\n")
-        suggestions.append("""
-### 4.1 目标期刊推荐
-
-**Tier 1 (Impact Factor > 10)**：
-- Tourism Management（最推荐）
-- Annals of Tourism Research
-
-**Tier 2 (Impact Factor 5-10)**：
-- Journal of Travel Research
-- International Journal of Hospitality Management
-- Journal of Sustainable Tourism
-
-**Tier 3 (Impact Factor 3-5)**：
-- Current Issues in Tourism
-- Tourism Geographies
-- Journal of Destination Marketing & Management
-
-### 4.2 提高接受率建议
-
-1. **预投稿**：先发会议论文（TTRA, ENTER）获取反馈
-2. **编辑desk-reject规避**：
-   - 严格遵循Author Guidelines
-   - 确保研究问题与期刊scope匹配
-   - 首页突出理论贡献
-3. **Cover Letter策略**：
-   - 强调novelty和timeliness
-   - 说明与期刊近期论文的关联
-4. **修改策略**：
-   - R&R后快速响应（2-3周内）
-   - 逐条回复审稿意见
-   - 使用表格展示修改
-
-### 4.3 时间规划
-
-| 阶段 | 预计时间 |
-|------|---------|
-| 文献综述 | 1-2个月 |
-| 数据收集 | 1-2个月 |
-| 数据分析 | 1个月 |
-| 写作初稿 | 1个月 |
-| 内部审阅 | 2周 |
-| 投稿-录用 | 6-12个月 |
-
-**建议总周期**：12-18个月
-""")
+        suggestions.append(_STATIC_STRATEGY)
         
         suggestions.append("\n---\n")
         
@@ -388,66 +910,76 @@ class AIAdvisor:
         if data['future_research']:
             suggestions.append("\n### 5.3 学界呼吁的未来研究方向\n")
             suggestions.append("基于对论文'Future Research'部分的文本挖掘：\n")
-            # 提取常见建议
-            from collections import Counter
-            future_words = Counter()
-            for text in data['future_research']:
-                words = text.lower().split()
-                future_words.update(w for w in words if len(w) > 5)
+            # 提取常见建议：拼接后一次findall，分词和长度过滤都在C层regex完成，
+            # 替代逐文档split+生成器过滤的解释器循环
+            corpus = ' '.join(data['future_research']).lower()
+            stopwords = _get_stopwords()
+            future_words = Counter(
+                w for w in _LONG_WORD_RE.findall(corpus) if w not in stopwords
+            )
             
             for word, count in future_words.most_common(10):
                 if count >= 2:
                     suggestions.append(f"- '{word}' mentioned in {count} papers\n")
         
-        suggestions.append("\n---\n")
-        suggestions.append("*报告生成时间：" + __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S') + "*")
-        
         return '\n'.join(suggestions)
     
     def _format_keywords(self, keywords: Dict) -> str:
         """格式化关键词"""
-        lines = []
-        for kw, freq in keywords.items():
-            lines.append(f"- {kw}: {freq}")
-        return '\n'.join(lines)
-    
+        return '\n'.join(f"- {kw}: {freq}" for kw, freq in keywords.items())
+
     def _format_papers(self, papers: List[Dict]) -> str:
         """格式化论文列表"""
-        lines = []
-        for i, p in enumerate(papers, 1):
-            lines.append(f"{i}. [{p.get('citations', 0)} citations] {p.get('title', 'Unknown')}")
-        return '\n'.join(lines)
-    
+        return '\n'.join(
+            f"{i}. [{p.get('citations', 0)} citations] {p.get('title', 'Unknown')}"
+            for i, p in enumerate(papers, 1)
+        )
+
     def _format_recent(self, papers: List[Dict]) -> str:
         """格式化最新论文"""
-        lines = []
-        for i, p in enumerate(papers, 1):
-            lines.append(f"{i}. [{p.get('year', 'N/A')}] {p.get('title', 'Unknown')}")
-        return '\n'.join(lines)
-    
+        return '\n'.join(
+            f"{i}. [{p.get('year', 'N/A')}] {p.get('title', 'Unknown')}"
+            for i, p in enumerate(papers, 1)
+        )
+
     def _format_list(self, items: List[str]) -> str:
-        """格式化列表"""
-        lines = []
-        for i, item in enumerate(items, 1):
-            # 截断过长的文本
-            text = item[:200] + '...' if len(item) > 200 else item
-            lines.append(f"{i}. \"{text}\"")
-        return '\n'.join(lines)
-    
+        """格式化列表（过长文本截断到200字符）
+
+        短条目直接f-string组装，不经过切片和+拼接的中间字符串"""
+        return '\n'.join(
+            f'{i}. "{item[:200]}..."' if len(item) > 200 else f'{i}. "{item}"'
+            for i, item in enumerate(items, 1)
+        )
+
     def _format_gaps(self, gaps: List[Dict]) -> str:
         """格式化研究缺口"""
         if not gaps:
             return "No specific gaps identified."
-        
-        lines = []
-        for gap in gaps:
-            lines.append(f"- **{gap['title']}**: {gap.get('description', 'N/A')[:100]}...")
-        return '\n'.join(lines)
+
+        return '\n'.join(
+            f"- **{gap['title']}**: {gap.get('description', 'N/A')[:100]}..."
+            for gap in gaps
+        )
     
     def save_suggestions(self, suggestions: str, filepath: str):
-        """保存建议到文件"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(suggestions)
+        """保存建议到文件（原子写入）
+
+        先整体预编码，再经大缓冲二进制句柄写入同目录临时文件，
+        最后rename替换——报告再大也不会留下半截文件，
+        且跳过文本模式的逐次编码开销。
+        """
+        payload = suggestions.encode('utf-8')
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filepath) or '.', suffix='.md')
+        try:
+            with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+                f.write(payload)
+            os.replace(tmp, filepath)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
         logger.info(f"AI建议已保存至: {filepath}")
     
     def interactive_qa(self, papers: List[Dict]) -> None:
@@ -475,38 +1007,32 @@ class AIAdvisor:
                 continue
             
             try:
-                message = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=2000,
-                    system=f"""你是一位资深的旅游学SSCI期刊编辑和学术研究顾问。
+                system = f"""你是一位资深的旅游学SSCI期刊编辑和学术研究顾问。
                     
 以下是基于{len(papers)}篇论文的分析数据：
 {context}
 
-请基于这些数据回答用户的问题，提供专业、具体、可操作的建议。用中文回答。""",
-                    messages=[
-                        {"role": "user", "content": question}
-                    ]
-                )
-                
+请基于这些数据回答用户的问题，提供专业、具体、可操作的建议。用中文回答。"""
+
+                cache_key = f"{system}\n\n[Q] {question}"
+
+                # 逐块打印，用户无需等完整回答生成完毕
+                print("\n" + "-" * 40)
+                for chunk in self._stream_api(question, system=system,
+                                              max_tokens=2000, cache_key=cache_key):
+                    print(chunk, end='', flush=True)
                 print("\n" + "-" * 40)
-                print(message.content[0].text)
-                print("-" * 40)
                 
             except Exception as e:
                 print(f"Error: {e}")
     
     def _build_context(self, papers: List[Dict]) -> str:
-        """构建上下文摘要"""
-        keyword_freq = Counter()
-        for p in papers:
-            keywords = p.get('all_keywords', p.get('keywords', []))
-            keyword_freq.update(keywords)
-        
+        """构建上下文摘要（关键词计数与年份范围走共享缓存，
+        与generate_suggestions同批论文不重复扫描）"""
+        keyword_freq, year_min, year_max = self._compute_keyword_stats(papers)
+
         top_kws = dict(keyword_freq.most_common(20))
-        
-        years = [p.get('year') for p in papers if p.get('year')]
-        year_range = f"{min(years)}-{max(years)}" if years else "N/A"
+        year_range = f"{year_min}-{year_max}" if year_min is not None else "N/A"
         
         return f"""
 - 论文数量: {len(papers)}
@@ -3,66 +3,166 @@
 包含关键词分析、突发词检测、LDA主题建模、研究缺口识别等功能
 """
 
+import csv
+import heapq
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional
 from collections import Counter, defaultdict
 import math
 import json
 
+# 可选加速依赖：装有numpy/scipy时，数值归约与共现统计走C层
+# （h-index比较、稀疏矩阵乘X.T @ X等），替代逐元素的纯Python循环；
+# 未安装则回退标准库实现，保持系统"仅需requests即可运行"的轻量定位
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from scipy import sparse
+    HAS_SCIPY = HAS_NUMPY
+except ImportError:
+    HAS_SCIPY = False
+
 logger = logging.getLogger(__name__)
 
+# Limitations/Future Research文本的分词正则：一次findall在C层
+# 完成切词和长度>=5过滤，省去split的完整token列表和逐词len判断
+_TOKEN_RE = re.compile(r'[a-z]{5,}')
+
+# 研究缺口4使用的新兴技术词表：模块常量，便于调整且不在每次调用时重建；
+# 用tuple保持确定的输出顺序
+_EMERGING_TECH = ('generative ai', 'chatgpt', 'llm', 'metaverse',
+                  'blockchain', 'iot', 'digital twin')
+
+
+def _norm_keywords(paper: Dict) -> frozenset:
+    """论文的规范化关键词frozenset，首次计算后memo在paper字典上
+
+    回退链all_keywords→keywords_normalized→keywords(lower)只走一次；
+    同一批论文字典被多个分析方法（乃至多个分析器实例）反复消费时，
+    后续访问都是一次字典查找。text_processor保存时会过滤掉该缓存键。
+    """
+    kws = paper.get('_norm_keywords')
+    if kws is None:
+        if paper.get('all_keywords'):
+            kws = frozenset(paper['all_keywords'])
+        elif paper.get('keywords_normalized'):
+            kws = frozenset(paper['keywords_normalized'])
+        elif paper.get('keywords'):
+            kws = frozenset(k.lower() for k in paper['keywords'])
+        else:
+            kws = frozenset()
+        paper['_norm_keywords'] = kws
+    return kws
+
+
+def _doc_term_matrix(docs: List[frozenset], vocab: Dict[str, int]):
+    """把文档关键词集合编码为二值CSR文档-词项矩阵（需scipy）
+
+    此后共现计数就是一次稀疏矩阵乘：C = X.T @ X，
+    对角线为词频，非对角线为词对共现次数。
+    """
+    indptr = [0]
+    indices = []
+    for doc in docs:
+        indices.extend(vocab[w] for w in doc if w in vocab)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(docs), len(vocab)))
+
 
 class TrendAnalyzer:
     """学术趋势分析器"""
     
     def __init__(self, n_topics: int = 8):
         self.n_topics = n_topics
-    
-    def analyze_keywords(self, papers: List[Dict]) -> Dict[str, int]:
+        self._kw_cache = None  # (id(papers), len, 关键词frozenset列表, 年份列表)
+        self._citations_cache = None  # (id(papers), len, int64被引数组)
+
+    def _extract_keywords(self, papers: List[Dict]) -> Tuple[List[frozenset], List[Optional[int]]]:
+        """一次遍历提取每篇论文的关键词frozenset与年份，并按论文列表缓存
+
+        analyze_keywords / analyze_keywords_by_year / build_cooccurrence_network /
+        lda_topic_modeling原本各自重走一遍all_keywords→keywords的回退链，
+        每篇每方法都新建set；这里提取一次后跨方法复用。
+        """
+        cached = self._kw_cache
+        if cached is not None and cached[0] == id(papers) and cached[1] == len(papers):
+            return cached[2], cached[3]
+
+        kw_sets = []
+        years = []
+        for paper in papers:
+            kw_sets.append(_norm_keywords(paper))
+            years.append(paper.get('year'))
+
+        self._kw_cache = (id(papers), len(papers), kw_sets, years)
+        return kw_sets, years
+
+    def run_all(self, papers: List[Dict]) -> Dict:
+        """并发执行全部独立分析
+
+        各项分析互不依赖，且numpy/scipy归约段释放GIL，
+        线程池即可重叠剩余的字典/Counter工作。关键词缓存先在主线程
+        预热（同时把_norm_keywords写到每个paper上），各任务只读共享。
+
+        Returns:
+            {'keyword_stats', 'burst_words', 'topics', 'gaps', 'citation_stats'}
+        """
+        self._extract_keywords(papers)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'keyword_stats': executor.submit(self.analyze_keywords, papers),
+                'burst_words': executor.submit(self.detect_burst_words, papers),
+                'topics': executor.submit(self.lda_topic_modeling, papers),
+                'gaps': executor.submit(self.identify_research_gaps, papers),
+                'citation_stats': executor.submit(self.get_citation_statistics, papers),
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def analyze_keywords(self, papers: List[Dict], top_n: Optional[int] = None) -> Dict[str, int]:
         """
         分析关键词频率
-        
+
+        Args:
+            papers: 论文列表
+            top_n: 只取频率最高的前N个；None为全量。
+                只消费头部时传top_n，most_common走堆选择（O(V log k)），
+                省掉对整个长尾词表的完整排序
+
         Returns:
             按频率排序的关键词字典
         """
+        kw_sets, _ = self._extract_keywords(papers)
+
         keyword_counter = Counter()
-        
-        for paper in papers:
-            # 合并所有关键词来源
-            keywords = set()
-            
-            if paper.get('all_keywords'):
-                keywords.update(paper['all_keywords'])
-            elif paper.get('keywords_normalized'):
-                keywords.update(paper['keywords_normalized'])
-            elif paper.get('keywords'):
-                keywords.update(k.lower() for k in paper['keywords'])
-            
-            keyword_counter.update(keywords)
-        
+        for kws in kw_sets:
+            keyword_counter.update(kws)
+
         # 按频率排序
-        sorted_keywords = dict(keyword_counter.most_common())
-        
+        sorted_keywords = dict(keyword_counter.most_common(top_n))
+
         logger.info(f"分析了 {len(sorted_keywords)} 个唯一关键词")
         return sorted_keywords
-    
+
     def analyze_keywords_by_year(self, papers: List[Dict]) -> Dict[int, Dict[str, int]]:
         """按年份分析关键词频率"""
+        kw_sets, years = self._extract_keywords(papers)
+
         yearly_keywords = defaultdict(Counter)
-        
-        for paper in papers:
-            year = paper.get('year')
+        for kws, year in zip(kw_sets, years):
             if not year:
                 continue
-            
-            keywords = set()
-            if paper.get('all_keywords'):
-                keywords.update(paper['all_keywords'])
-            elif paper.get('keywords'):
-                keywords.update(k.lower() for k in paper['keywords'])
-            
-            yearly_keywords[year].update(keywords)
-        
+            yearly_keywords[year].update(kws)
+
         # 转换为普通字典并排序
         result = {}
         for year in sorted(yearly_keywords.keys()):
@@ -84,56 +184,83 @@ class TrendAnalyzer:
         Returns:
             突发词列表，包含增长率等信息
         """
-        # 按年份统计关键词
-        yearly_keywords = self.analyze_keywords_by_year(papers)
-        
-        if len(yearly_keywords) < 2:
+        # 只需要"最近两年"与"较早年份"两个Counter，
+        # 直接在一趟遍历中分桶累加，不经过完整的按年字典中间结构
+        kw_sets, paper_years = self._extract_keywords(papers)
+        years = sorted({y for y in paper_years if y})
+
+        if len(years) < 2:
             logger.warning("数据年份不足，无法检测突发词")
             return []
-        
-        years = sorted(yearly_keywords.keys())
-        recent_years = years[-2:]  # 最近两年
-        earlier_years = years[:-2] if len(years) > 2 else years[:1]
-        
+
+        recent_years = set(years[-2:])  # 最近两年
+        earlier_years = set(years[:-2]) if len(years) > 2 else {years[0]}
+
         # 计算增长率
         burst_words = []
-        
-        # 获取最近年份的关键词
+
         recent_keywords = Counter()
-        for year in recent_years:
-            recent_keywords.update(yearly_keywords.get(year, {}))
-        
-        # 获取较早年份的关键词
         earlier_keywords = Counter()
-        for year in earlier_years:
-            earlier_keywords.update(yearly_keywords.get(year, {}))
-        
+        for kws, year in zip(kw_sets, paper_years):
+            if not year:
+                continue
+            # 年份只有两个时首年同时落入两个窗口，与原分桶逻辑一致
+            if year in recent_years:
+                recent_keywords.update(kws)
+            if year in earlier_years:
+                earlier_keywords.update(kws)
+
         # 计算每个关键词的增长率
-        for keyword, recent_freq in recent_keywords.items():
-            earlier_freq = earlier_keywords.get(keyword, 0)
-            
-            # 计算增长率（使用平滑处理避免除零）
-            if earlier_freq == 0:
-                # 新出现的词
-                growth_rate = float('inf') if recent_freq >= 3 else recent_freq
-                is_new = True
-            else:
-                growth_rate = (recent_freq - earlier_freq) / earlier_freq
-                is_new = False
-            
+        if HAS_NUMPY and recent_keywords:
+            # 按共享词表对齐成两条整型数组，增长率/筛选掩码整批在C层算出，
+            # Python只为幸存的少数词（通常<5%）构建结果字典
+            kws = list(recent_keywords)
+            r = np.fromiter((recent_keywords[k] for k in kws),
+                            dtype=np.int64, count=len(kws))
+            e = np.fromiter((earlier_keywords.get(k, 0) for k in kws),
+                            dtype=np.int64, count=len(kws))
+            new_mask = e == 0
+            # 新词：频率>=3记为归一化增长率10.0，否则取频率本身；旧词：相对增长
+            growth = np.where(new_mask,
+                              np.where(r >= 3, 10.0, r.astype(np.float64)),
+                              (r - e) / np.maximum(e, 1))
             # 只关注显著增长的词（增长率 > 50% 或新出现频率 >= 3）
-            if growth_rate > 0.5 or (is_new and recent_freq >= 3):
+            for i in np.nonzero(growth > 0.5)[0]:
                 burst_words.append({
-                    'keyword': keyword,
-                    'recent_freq': recent_freq,
-                    'earlier_freq': earlier_freq,
-                    'growth_rate': growth_rate if growth_rate != float('inf') else 10.0,  # 归一化无穷大
-                    'is_new': is_new,
+                    'keyword': kws[i],
+                    'recent_freq': int(r[i]),
+                    'earlier_freq': int(e[i]),
+                    'growth_rate': float(growth[i]),
+                    'is_new': bool(new_mask[i]),
                     'trend': 'rising'
                 })
-        
-        # 按增长率排序
-        burst_words.sort(key=lambda x: (-x['growth_rate'], -x['recent_freq']))
+        else:
+            for keyword, recent_freq in recent_keywords.items():
+                earlier_freq = earlier_keywords.get(keyword, 0)
+
+                # 计算增长率（使用平滑处理避免除零）
+                if earlier_freq == 0:
+                    # 新出现的词：频率>=3直接记归一化增长率10.0，
+                    # 省去inf哨兵和落袋前的二次归一化分支
+                    growth_rate = 10.0 if recent_freq >= 3 else recent_freq
+                    is_new = True
+                else:
+                    growth_rate = (recent_freq - earlier_freq) / earlier_freq
+                    is_new = False
+
+                # 只关注显著增长的词（增长率 > 50%，新词归一化后天然满足）
+                if growth_rate > 0.5:
+                    burst_words.append({
+                        'keyword': keyword,
+                        'recent_freq': recent_freq,
+                        'earlier_freq': earlier_freq,
+                        'growth_rate': growth_rate,
+                        'is_new': is_new,
+                        'trend': 'rising'
+                    })
+
+        # 按增长率（并列时按近期频率）降序：itemgetter取键在C层完成
+        burst_words.sort(key=itemgetter('growth_rate', 'recent_freq'), reverse=True)
         
         logger.info(f"检测到 {len(burst_words)} 个突发词")
         return burst_words
@@ -145,40 +272,83 @@ class TrendAnalyzer:
         由于避免依赖重型库，这里实现一个简化版的主题提取
         基于关键词共现和聚类
         """
-        # 收集所有文档的关键词
+        # 收集所有文档的关键词（复用共享的关键词缓存，只补充摘要token），
+        # 词频在同一趟里顺手累计，不再对语料做第二次遍历
+        kw_sets, _ = self._extract_keywords(papers)
         documents = []
-        for paper in papers:
-            keywords = set()
-            if paper.get('all_keywords'):
-                keywords.update(paper['all_keywords'])
-            if paper.get('abstract_tokens'):
-                keywords.update(paper['abstract_tokens'][:20])  # 取前20个token
-            documents.append(list(keywords))
-        
-        # 计算词频
         word_freq = Counter()
-        for doc in documents:
-            word_freq.update(doc)
-        
+        for kws, paper in zip(kw_sets, papers):
+            tokens = paper.get('abstract_tokens')
+            if tokens:
+                kws = kws | frozenset(tokens[:20])  # 取前20个token
+            documents.append(kws)
+            word_freq.update(kws)
+
         # 过滤低频词
         min_freq = max(2, len(documents) * 0.01)  # 至少出现在1%的文档中
         valid_words = {w for w, f in word_freq.items() if f >= min_freq}
         
         # 构建共现矩阵
-        cooccurrence = defaultdict(Counter)
-        for doc in documents:
-            doc_words = [w for w in doc if w in valid_words]
-            for i, w1 in enumerate(doc_words):
-                for w2 in doc_words[i+1:]:
-                    cooccurrence[w1][w2] += 1
-                    cooccurrence[w2][w1] += 1
-        
+        if HAS_SCIPY and valid_words:
+            # 稀疏矩阵乘一次算出全部词对共现，种子词的Top-k邻居
+            # 直接在CSR行上做argpartition，Python层不再逐对计数
+            vocab = {w: i for i, w in enumerate(valid_words)}
+            id_to_term = list(vocab)
+            X = _doc_term_matrix(documents, vocab)
+            C = (X.T @ X).tocsr()
+            C.setdiag(0)
+            C.eliminate_zeros()
+
+            def top_related(seed: str, k: int = 20) -> List[Tuple[str, int]]:
+                row = C.getrow(vocab[seed])
+                data, cols = row.data, row.indices
+                if len(data) > k:
+                    sel = np.argpartition(-data, k)[:k]
+                    order = sel[np.argsort(-data[sel])]
+                else:
+                    order = np.argsort(-data)
+                return [(id_to_term[cols[i]], int(data[i])) for i in order]
+
+            def count_docs(topic_words: List[str]) -> int:
+                # 主题覆盖文档数 = 对应列子矩阵按行求和后非零的行数，
+                # 一次C层归约替代逐文档求交集
+                cols = [vocab[w] for w in topic_words if w in vocab]
+                if not cols:
+                    return 0
+                return int((np.asarray(X[:, cols].sum(axis=1)).ravel() > 0).sum())
+        else:
+            cooccurrence = defaultdict(Counter)
+            for doc in documents:
+                doc_words = [w for w in doc if w in valid_words]
+                for i, w1 in enumerate(doc_words):
+                    for w2 in doc_words[i+1:]:
+                        cooccurrence[w1][w2] += 1
+                        cooccurrence[w2][w1] += 1
+
+            def top_related(seed: str, k: int = 20) -> List[Tuple[str, int]]:
+                return cooccurrence[seed].most_common(k)
+
+            # 倒排索引：词 -> 含该词的文档id集合，建一次后
+            # 每个主题的覆盖文档数只是若干posting集合的并集大小，
+            # 不再对全部文档逐一求交集
+            postings = defaultdict(set)
+            for doc_id, doc in enumerate(documents):
+                for w in doc:
+                    if w in valid_words:
+                        postings[w].add(doc_id)
+
+            def count_docs(topic_words: List[str]) -> int:
+                return len(set().union(*(postings[w] for w in topic_words if w in postings))) \
+                    if topic_words else 0
+
         # 简单聚类：基于共现关系分组
         used_words = set()
         topics = []
         
-        # 按频率排序的种子词
-        seed_words = sorted(valid_words, key=lambda w: -word_freq[w])
+        # 种子词候选池：最多消费n_topics个种子（加上used_words跳过的余量），
+        # 堆选前10倍头部即可，不必对整个词表做完整排序
+        seed_words = heapq.nlargest(self.n_topics * 10, valid_words,
+                                    key=word_freq.__getitem__)
         
         for seed in seed_words:
             if seed in used_words:
@@ -187,7 +357,7 @@ class TrendAnalyzer:
                 break
             
             # 找出与种子词共现最多的词
-            related = cooccurrence[seed].most_common(20)
+            related = top_related(seed)
             topic_words = [seed]
             
             for word, _ in related:
@@ -200,7 +370,7 @@ class TrendAnalyzer:
                     'keywords': topic_words,
                     'label': self._generate_topic_label(topic_words),
                     'description': self._generate_topic_description(topic_words),
-                    'document_count': self._count_topic_documents(documents, topic_words)
+                    'document_count': count_docs(topic_words)
                 })
                 used_words.update(topic_words)
         
@@ -225,15 +395,6 @@ class TrendAnalyzer:
         else:
             return f"This topic centers on {keywords[0]}."
     
-    def _count_topic_documents(self, documents: List[List[str]], topic_keywords: List[str]) -> int:
-        """计算包含主题关键词的文档数"""
-        topic_set = set(topic_keywords)
-        count = 0
-        for doc in documents:
-            if topic_set & set(doc):  # 有交集
-                count += 1
-        return count
-    
     def build_cooccurrence_network(self, papers: List[Dict], top_n: int = 50) -> Dict:
         """
         构建关键词共现网络
@@ -241,30 +402,16 @@ class TrendAnalyzer:
         Returns:
             网络数据，包含节点和边
         """
-        # 计算词频
-        keyword_freq = self.analyze_keywords(papers)
-        top_keywords = list(keyword_freq.keys())[:top_n]
-        
-        # 构建共现矩阵
-        cooccurrence = defaultdict(int)
-        
-        for paper in papers:
-            keywords = set()
-            if paper.get('all_keywords'):
-                keywords.update(paper['all_keywords'])
-            elif paper.get('keywords'):
-                keywords.update(k.lower() for k in paper['keywords'])
-            
-            # 过滤到top关键词
-            keywords = keywords & set(top_keywords)
-            keywords = list(keywords)
-            
-            # 记录共现
-            for i, kw1 in enumerate(keywords):
-                for kw2 in keywords[i+1:]:
-                    pair = tuple(sorted([kw1, kw2]))
-                    cooccurrence[pair] += 1
-        
+        # 计算词频（只需要前top_n个，堆选择替代全量排序）
+        keyword_freq = self.analyze_keywords(papers, top_n=top_n)
+        top_keywords = list(keyword_freq.keys())
+
+        # 关键词映射为整数ID，内层计数循环只处理整数，
+        # 避免每个词对都做字符串排序和哈希
+        kw_to_id = {kw: i for i, kw in enumerate(top_keywords)}
+
+        kw_sets, _ = self._extract_keywords(papers)
+
         # 构建网络数据
         nodes = []
         for kw in top_keywords:
@@ -273,15 +420,40 @@ class TrendAnalyzer:
                 'label': kw,
                 'size': keyword_freq.get(kw, 1)
             })
-        
+
         edges = []
-        for (source, target), weight in cooccurrence.items():
-            if weight >= 2:  # 至少共现2次
-                edges.append({
-                    'source': source,
-                    'target': target,
-                    'weight': weight
-                })
+        if HAS_SCIPY and top_keywords:
+            # 稀疏矩阵乘一次得到全部词对计数，只遍历上三角的非零项
+            X = _doc_term_matrix(kw_sets, kw_to_id)
+            C = (X.T @ X).tocoo()
+            for id1, id2, weight in zip(C.row, C.col, C.data):
+                if id1 < id2 and weight >= 2:  # 至少共现2次
+                    edges.append({
+                        'source': top_keywords[id1],
+                        'target': top_keywords[id2],
+                        'weight': int(weight)
+                    })
+        else:
+            cooccurrence = Counter()
+            for keywords in kw_sets:
+                # 过滤到top关键词并转为有序ID列表
+                ids = sorted(kw_to_id[kw] for kw in keywords if kw in kw_to_id)
+
+                # 记录共现：词对打包成单个int（小ID<<32|大ID），
+                # 计数键是整数而非tuple——哈希更快且零元组分配
+                cooccurrence.update(
+                    (a << 32) | b
+                    for i, a in enumerate(ids)
+                    for b in ids[i + 1:]
+                )
+
+            for key, weight in cooccurrence.items():
+                if weight >= 2:  # 至少共现2次
+                    edges.append({
+                        'source': top_keywords[key >> 32],
+                        'target': top_keywords[key & 0xFFFFFFFF],
+                        'weight': weight
+                    })
         
         # 按权重排序
         edges.sort(key=lambda x: -x['weight'])
@@ -307,39 +479,38 @@ class TrendAnalyzer:
         future_themes = Counter()
         
         for paper in papers:
-            if paper.get('limitations'):
+            limitations = paper.get('limitations')
+            if limitations:
                 # 简单提取关键词
-                words = paper['limitations'].lower().split()
-                limitation_themes.update(w for w in words if len(w) > 4)
-            
-            if paper.get('future_research'):
-                words = paper['future_research'].lower().split()
-                future_themes.update(w for w in words if len(w) > 4)
+                limitation_themes.update(_TOKEN_RE.findall(limitations.lower()))
+
+            future = paper.get('future_research')
+            if future:
+                future_themes.update(_TOKEN_RE.findall(future.lower()))
         
         # 2. 找出被多篇论文提到的研究方向
         common_future = [w for w, c in future_themes.most_common(20) if c >= 2]
         common_limitations = [w for w, c in limitation_themes.most_common(20) if c >= 2]
         
         # 3. 分析高被引但低频的关键词组合（潜力选题）
-        keyword_citations = defaultdict(list)
+        # 只需要均值，累计和+计数两个Counter即可，
+        # 不必为每个关键词维护一个被引列表
+        keyword_citation_sum = Counter()
         keyword_freq = Counter()
-        
+
         for paper in papers:
             citations = paper.get('citations', 0)
-            keywords = paper.get('all_keywords', paper.get('keywords', []))
-            
-            for kw in keywords:
-                kw = kw.lower() if isinstance(kw, str) else str(kw)
-                keyword_citations[kw].append(citations)
+
+            for kw in _norm_keywords(paper):
+                keyword_citation_sum[kw] += citations
                 keyword_freq[kw] += 1
-        
+
         # 计算每个关键词的平均被引
         high_impact_low_freq = []
-        for kw, cites in keyword_citations.items():
-            if len(cites) >= 2:  # 至少出现2次
-                avg_cite = sum(cites) / len(cites)
-                freq = keyword_freq[kw]
-                
+        for kw, freq in keyword_freq.items():
+            if freq >= 2:  # 至少出现2次
+                avg_cite = keyword_citation_sum[kw] / freq
+
                 # 高被引(>10)但低频(<5)
                 if avg_cite > 10 and freq < 5:
                     high_impact_low_freq.append({
@@ -386,13 +557,8 @@ class TrendAnalyzer:
                 'potential_topics': top_potential
             })
         
-        # Gap 4: 新兴技术应用
-        emerging_tech = ['generative ai', 'chatgpt', 'llm', 'metaverse', 'blockchain', 'iot', 'digital twin']
-        tech_gaps = []
-        for tech in emerging_tech:
-            freq = keyword_freq.get(tech, 0)
-            if freq < 10:  # 如果该技术在旅游研究中还不够普及
-                tech_gaps.append(tech)
+        # Gap 4: 新兴技术应用（频率<10视为在旅游研究中还不够普及）
+        tech_gaps = [tech for tech in _EMERGING_TECH if keyword_freq.get(tech, 0) < 10]
         
         if tech_gaps:
             gaps.append({
@@ -407,29 +573,72 @@ class TrendAnalyzer:
         logger.info(f"识别出 {len(gaps)} 个研究缺口")
         return gaps
     
-    def calculate_h_index(self, papers: List[Dict]) -> int:
-        """计算h-index（基于论文被引）"""
-        citations = sorted([p.get('citations', 0) for p in papers], reverse=True)
-        
+    def _citations_array(self, papers: List[Dict]):
+        """论文被引的紧凑int64数组（需numpy），按论文列表缓存
+
+        相比装箱int列表内存占用缩小数倍，且h-index与引用统计
+        消费同一份数组，不重复抽取citations字段。
+        """
+        cached = self._citations_cache
+        if cached is not None and cached[0] == id(papers) and cached[1] == len(papers):
+            return cached[2]
+
+        c = np.fromiter((p.get('citations', 0) for p in papers),
+                        dtype=np.int64, count=len(papers))
+        self._citations_cache = (id(papers), len(papers), c)
+        return c
+
+    @staticmethod
+    def _h_index_from_sorted(citations) -> int:
+        """从降序被引数组/列表计算h-index"""
+        if HAS_NUMPY and isinstance(citations, np.ndarray):
+            # 整条比较+求和在C层完成：h = |{i: c_i >= i+1}|（c降序时前缀为True）
+            return int((citations >= np.arange(1, len(citations) + 1)).sum())
+
         h = 0
         for i, c in enumerate(citations):
             if c >= i + 1:
                 h = i + 1
             else:
                 break
-        
         return h
-    
+
+    def calculate_h_index(self, papers: List[Dict]) -> int:
+        """计算h-index（基于论文被引）"""
+        if HAS_NUMPY:
+            c = self._citations_array(papers)
+            c[::-1].sort()  # 原地降序
+            return self._h_index_from_sorted(c)
+
+        citations = sorted([p.get('citations', 0) for p in papers], reverse=True)
+        return self._h_index_from_sorted(citations)
+
     def get_citation_statistics(self, papers: List[Dict]) -> Dict:
         """获取引用统计"""
-        citations = [p.get('citations', 0) for p in papers]
-        
-        if not citations:
+        if not papers:
             return {}
-        
+
+        if HAS_NUMPY:
+            # 被引数组只物化一次（与calculate_h_index共享缓存），
+            # 归约（sum/max/median/阈值计数）都是C层单趟
+            c = self._citations_array(papers)
+            count = len(c)
+            total = int(c.sum())
+            c[::-1].sort()
+            return {
+                'total_citations': total,
+                'paper_count': count,
+                'mean_citations': total / count,
+                'median_citations': int(c[(count - 1) // 2]),  # c降序，对应升序第count//2位
+                'max_citations': int(c[0]),
+                'h_index': self._h_index_from_sorted(c),
+                'highly_cited_papers': int((c > 50).sum()),  # 被引>50的论文数
+            }
+
+        citations = [p.get('citations', 0) for p in papers]
         total = sum(citations)
         count = len(citations)
-        
+
         return {
             'total_citations': total,
             'paper_count': count,
@@ -441,52 +650,67 @@ class TrendAnalyzer:
         }
     
     def save_keyword_stats(self, stats: Dict[str, int], filepath: str):
-        """保存关键词统计"""
-        with open(filepath, 'w', encoding='utf-8-sig') as f:
-            f.write('Keyword,Frequency\n')
-            for kw, freq in stats.items():
-                f.write(f'"{kw}",{freq}\n')
+        """保存关键词统计（csv.writer在C层做引号转义，writerows批量写出）"""
+        with open(filepath, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(['Keyword', 'Frequency'])
+            writer.writerows(stats.items())
         logger.info(f"关键词统计已保存至: {filepath}")
-    
+
     def save_burst_words(self, burst_words: List[Dict], filepath: str):
-        """保存突发词"""
-        with open(filepath, 'w', encoding='utf-8-sig') as f:
-            f.write('Keyword,Recent_Freq,Earlier_Freq,Growth_Rate,Is_New,Trend\n')
-            for bw in burst_words:
-                f.write(f'"{bw["keyword"]}",{bw["recent_freq"]},{bw["earlier_freq"]},{bw["growth_rate"]:.2f},{bw["is_new"]},{bw["trend"]}\n')
+        """保存突发词（csv.writer在C层做引号转义，writerows批量写出）"""
+        with open(filepath, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(['Keyword', 'Recent_Freq', 'Earlier_Freq',
+                             'Growth_Rate', 'Is_New', 'Trend'])
+            writer.writerows(
+                (bw['keyword'], bw['recent_freq'], bw['earlier_freq'],
+                 f"{bw['growth_rate']:.2f}", bw['is_new'], bw['trend'])
+                for bw in burst_words
+            )
         logger.info(f"突发词已保存至: {filepath}")
     
     def save_topics(self, topics: List[Dict], filepath: str):
-        """保存LDA主题"""
+        """保存LDA主题（内容在内存拼好后一次写出）"""
+        parts = [
+            "=" * 60 + "\n",
+            "LDA Topic Modeling Results\n",
+            "=" * 60 + "\n\n",
+        ]
+        for topic in topics:
+            parts.extend((
+                f"Topic {topic['id']}: {topic['label']}\n",
+                "-" * 40 + "\n",
+                f"Keywords: {', '.join(topic['keywords'])}\n",
+                f"Document Count: {topic['document_count']}\n",
+                f"Description: {topic['description']}\n",
+                "\n",
+            ))
+
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("LDA Topic Modeling Results\n")
-            f.write("=" * 60 + "\n\n")
-            
-            for topic in topics:
-                f.write(f"Topic {topic['id']}: {topic['label']}\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Keywords: {', '.join(topic['keywords'])}\n")
-                f.write(f"Document Count: {topic['document_count']}\n")
-                f.write(f"Description: {topic['description']}\n")
-                f.write("\n")
-        
+            f.write(''.join(parts))
+
         logger.info(f"LDA主题已保存至: {filepath}")
-    
+
     def save_gaps(self, gaps: List[Dict], filepath: str):
-        """保存研究缺口"""
+        """保存研究缺口（内容在内存拼好后一次写出）"""
+        parts = [
+            "=" * 60 + "\n",
+            "Research Gap Analysis\n",
+            "=" * 60 + "\n\n",
+        ]
+        for gap in gaps:
+            parts.extend((
+                f"Gap {gap['id']}: {gap['title']}\n",
+                "-" * 40 + "\n",
+                f"Description: {gap['description']}\n",
+                f"Source Count: {gap['source_count']}\n",
+                f"Keywords: {', '.join(gap.get('keywords', []))}\n",
+                f"Opportunity: {gap['opportunity']}\n",
+                "\n",
+            ))
+
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("Research Gap Analysis\n")
-            f.write("=" * 60 + "\n\n")
-            
-            for gap in gaps:
-                f.write(f"Gap {gap['id']}: {gap['title']}\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Description: {gap['description']}\n")
-                f.write(f"Source Count: {gap['source_count']}\n")
-                f.write(f"Keywords: {', '.join(gap.get('keywords', []))}\n")
-                f.write(f"Opportunity: {gap['opportunity']}\n")
-                f.write("\n")
-        
+            f.write(''.join(parts))
+
         logger.info(f"研究缺口已保存至: {filepath}")
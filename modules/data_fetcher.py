@@ -10,20 +10,140 @@
 
 import requests
 import time
+import math
 import logging
 import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import chain
 from typing import List, Dict, Optional
 import random
 
+# 可选加速：numpy可用时摘要倒排索引的还原走C层argsort+花式索引，
+# 未安装则用单次排序的纯标准库实现（本模块保持仅requests可运行）
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# API响应解析：优先orjson（Rust实现，解析带倒排索引的大页面快2-3倍），
+# 未安装时回退标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# 去重用的标题规范化：去掉字母数字和空格以外的字符
+_TITLE_NORM_RE = re.compile(r'[^a-z0-9 ]+')
+
+# OpenAlex礼貌池：带mailto参数的请求进入更高速率配额
+_OPENALEX_MAILTO = 'researcher@university.edu'
+
+# OpenAlex字段选择：完整版含abstract_inverted_index（常占响应体积的80%），
+# 精简版只取列表/排序所需字段，供两阶段抓取的清单pass使用
+_OPENALEX_SELECT_FULL = ('id,doi,title,publication_year,abstract_inverted_index,'
+                         'authorships,primary_location,cited_by_count,concepts,keywords')
+_OPENALEX_SELECT_LEAN = 'id,doi,title,publication_year,cited_by_count'
+
+
+def _dedup_key(paper: Dict) -> Optional[tuple]:
+    """跨数据源去重键
+
+    优先规范化DOI（小写、去协议前缀）；无DOI时退回
+    规范化标题（小写、去标点、压缩空白）+年份，
+    吸收不同数据源间的大小写/标点/DOI前缀差异。
+    """
+    doi = (paper.get('doi') or '').lower().replace('https://doi.org/', '').strip()
+    if doi:
+        return ('doi', doi)
+
+    title = paper.get('title') or ''
+    if not title:
+        return None
+    norm_title = ' '.join(_TITLE_NORM_RE.sub(' ', title.lower()).split())
+    if not norm_title:
+        return None
+    return ('title', norm_title, paper.get('year'))
+
+
+def _decode_inverted_index(inv_index: Dict[str, List[int]]) -> str:
+    """把OpenAlex的倒排索引摘要还原为原文词序的文本
+
+    numpy路径：位置与词id展平成两条int32数组，一次stable argsort
+    后按序gather；回退路径：构建(位置, 词)对列表做单次C层排序，
+    避免逐位置的字典插入和对键的二次排序。
+    """
+    if HAS_NUMPY:
+        words = list(inv_index)
+        lens = [len(positions) for positions in inv_index.values()]
+        positions = np.fromiter(chain.from_iterable(inv_index.values()),
+                                dtype=np.int32, count=sum(lens))
+        word_ids = np.repeat(np.arange(len(words), dtype=np.int32), lens)
+        order = np.argsort(positions, kind='stable')
+        return ' '.join(words[i] for i in word_ids[order])
+
+    pairs = [(pos, word) for word, positions in inv_index.items() for pos in positions]
+    pairs.sort()
+    return ' '.join(word for _, word in pairs)
+
+
+class _TokenBucket:
+    """线程安全的令牌桶限速器
+
+    替代各抓取函数里的固定time.sleep常数：没有请求在飞时不会白等，
+    多线程并发抓取时也不会突破对应API的礼貌速率上限。
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate  # 每秒补充的令牌数
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """阻塞直到取得一个令牌"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class DataFetcher:
     """学术论文数据获取器"""
     
     def __init__(self):
-        self.session = requests.Session()
+        # HTTP层持久缓存（可选）：装有requests-cache时，相同URL+参数的
+        # API响应24小时内直接从本地SQLite返回（约百微秒级），
+        # 重复检索同一批关键词不再重新下载；未安装则用普通Session
+        try:
+            from requests_cache import CachedSession
+            self.session = CachedSession(
+                '.api_cache', backend='sqlite', expire_after=86400,
+                cache_control=True
+            )
+            logger.info("已启用HTTP响应缓存 (.api_cache.sqlite)")
+        except ImportError:
+            self.session = requests.Session()
+
+        # 扩大连接池：默认pool_maxsize=10在多线程并发抓取时会挤占连接、
+        # 反复重建TLS握手，调到32让各工作线程都能复用keep-alive长连接
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'SSCI-Tourism-Analyzer/2.0 (Academic Research Tool; mailto:researcher@university.edu)'
         })
@@ -32,6 +152,14 @@ class DataFetcher:
         self.openalex_base = "https://api.openalex.org"
         self.semantic_scholar_base = "https://api.semanticscholar.org/graph/v1"
         self.crossref_base = "https://api.crossref.org"
+
+        # 各数据源的礼貌速率上限（OpenAlex约10 req/s，S2免认证1 req/s，
+        # Crossref保守2 req/s），所有请求先过对应令牌桶
+        self._limiters = {
+            'openalex': _TokenBucket(8),
+            'semantic_scholar': _TokenBucket(1),
+            'crossref': _TokenBucket(2),
+        }
         
         # 旅游类SSCI期刊的OpenAlex ID
         self.tourism_journals = {
@@ -45,30 +173,33 @@ class DataFetcher:
             "Journal of Destination Marketing & Management": "S2764825156"
         }
     
-    def fetch_papers(self, keywords: List[str], year_start: int, year_end: int, 
-                     max_results: int = 500, sources: List[str] = None) -> List[Dict]:
+    def fetch_papers(self, keywords: List[str], year_start: int, year_end: int,
+                     max_results: int = 500, sources: List[str] = None,
+                     progress_callback=None) -> List[Dict]:
         """
         获取论文数据
-        
+
         Args:
             keywords: 搜索关键词列表
             year_start: 起始年份
             year_end: 结束年份
             max_results: 最大结果数
             sources: 数据源列表 ['openalex', 'semantic_scholar', 'crossref']
-        
+            progress_callback: 可选回调 (已完成页数, 总页数)，用于UI进度展示
+
         Returns:
             论文数据列表
         """
         if sources is None:
             sources = ['openalex']  # 默认使用OpenAlex
-        
+
         all_papers = []
-        
+
         for source in sources:
             try:
                 if source == 'openalex':
-                    papers = self._fetch_from_openalex(keywords, year_start, year_end, max_results)
+                    papers = self._fetch_from_openalex(keywords, year_start, year_end, max_results,
+                                                       progress_callback=progress_callback)
                 elif source == 'semantic_scholar':
                     papers = self._fetch_from_semantic_scholar(keywords, year_start, year_end, max_results)
                 elif source == 'crossref':
@@ -83,94 +214,156 @@ class DataFetcher:
             except Exception as e:
                 logger.error(f"从 {source} 获取数据失败: {e}")
         
-        # 去重（基于DOI或标题）
-        seen = set()
+        # 去重（规范化DOI优先，无DOI时按规范化标题+年份）；
+        # 重复记录不直接丢弃：被引取各源最大值，正文保留元数据更完整的一条
+        seen = {}
         unique_papers = []
         for paper in all_papers:
-            key = paper.get('doi') or paper.get('title', '')
-            if key and key not in seen:
-                seen.add(key)
+            key = _dedup_key(paper)
+            if not key:
+                continue
+
+            idx = seen.get(key)
+            if idx is None:
+                seen[key] = len(unique_papers)
                 unique_papers.append(paper)
+                continue
+
+            kept = unique_papers[idx]
+            citations = max(kept.get('citations', 0), paper.get('citations', 0))
+            # 摘要更长（其次作者更多）的记录视为更完整
+            if (len(paper.get('abstract') or ''), len(paper.get('authors') or ())) > \
+               (len(kept.get('abstract') or ''), len(kept.get('authors') or ())):
+                unique_papers[idx] = kept = paper
+            kept['citations'] = citations
         
         logger.info(f"去重后共 {len(unique_papers)} 篇论文")
         return unique_papers
     
-    def _fetch_from_openalex(self, keywords: List[str], year_start: int, 
-                             year_end: int, max_results: int) -> List[Dict]:
-        """从OpenAlex获取数据"""
-        papers = []
+    def _fetch_from_openalex(self, keywords: List[str], year_start: int,
+                             year_end: int, max_results: int,
+                             progress_callback=None,
+                             abstract_top_k: Optional[int] = None) -> List[Dict]:
+        """从OpenAlex获取数据（多页并发请求）
+
+        abstract_top_k不为None时走两阶段抓取：清单pass只取精简字段
+        （省掉占响应大头的abstract_inverted_index），随后仅对被引
+        前top_k的论文批量补全摘要等完整元数据，带宽受限时显著提速。
+        """
         query = ' '.join(keywords)
-        
+
         # 构建过滤器
         filters = [
             f"publication_year:{year_start}-{year_end}",
             "type:article",
             "has_abstract:true"
         ]
-        
+
         # 添加旅游期刊过滤（可选）
         # filters.append(f"primary_location.source.id:{list(self.tourism_journals.values())[0]}")
-        
-        params = {
+
+        per_page = min(200, max_results)
+        n_pages = math.ceil(max_results / per_page)
+
+        base_params = {
             'search': query,
             'filter': ','.join(filters),
-            'per_page': min(200, max_results),
+            'per_page': per_page,
             'sort': 'cited_by_count:desc',
-            'select': 'id,doi,title,publication_year,abstract_inverted_index,authorships,primary_location,cited_by_count,concepts,keywords'
+            'select': _OPENALEX_SELECT_LEAN if abstract_top_k is not None else _OPENALEX_SELECT_FULL,
+            'mailto': _OPENALEX_MAILTO
         }
-        
-        cursor = '*'
-        page = 0
-        
-        while len(papers) < max_results:
-            params['cursor'] = cursor
-            
-            try:
-                response = self.session.get(
-                    f"{self.openalex_base}/works",
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                results = data.get('results', [])
-                if not results:
-                    break
-                
-                for item in results:
-                    paper = self._parse_openalex_paper(item)
-                    if paper:
-                        papers.append(paper)
-                
-                cursor = data.get('meta', {}).get('next_cursor')
-                if not cursor:
-                    break
-                
-                page += 1
-                logger.debug(f"OpenAlex: 第{page}页，已获取 {len(papers)} 篇")
-                
-                # 遵守API速率限制
-                time.sleep(0.1)
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"OpenAlex API请求失败: {e}")
-                break
-        
-        return papers[:max_results]
-    
+
+        def fetch_page(page: int):
+            self._limiters['openalex'].acquire()
+            response = self.session.get(
+                f"{self.openalex_base}/works",
+                params=dict(base_params, page=page),
+                timeout=30
+            )
+            response.raise_for_status()
+            # 解析（JSON+倒排索引还原）就在工作线程里完成，
+            # 与其余页面的网络等待重叠，主线程只做拼接
+            results = _json_loads(response.content).get('results', [])
+            return page, [paper for paper in map(self._parse_openalex_paper, results) if paper]
+
+        # 并发抓取分页，网络往返相互重叠；
+        # 并发数上限10，与OpenAlex约10 req/s的礼貌限制一致
+        page_results = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(10, n_pages)) as executor:
+            futures = [executor.submit(fetch_page, p) for p in range(1, n_pages + 1)]
+            for future in as_completed(futures):
+                try:
+                    page, results = future.result()
+                    page_results[page] = results
+                    logger.debug(f"OpenAlex: 第{page}页获取 {len(results)} 篇")
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"OpenAlex API请求失败: {e}")
+                done += 1
+                if progress_callback:
+                    progress_callback(done, n_pages)
+
+        # 按页序拼接（各页已在工作线程解析完毕），保持cited_by_count排序稳定
+        papers = []
+        for page in sorted(page_results):
+            papers.extend(page_results[page])
+        papers = papers[:max_results]
+
+        # 两阶段模式：清单已按被引降序，只给前top_k批量补全完整记录
+        if abstract_top_k is not None and papers:
+            top = papers[:abstract_top_k]
+            hydrated = {p['id']: p for p in self._hydrate_openalex([q['id'] for q in top])}
+            papers[:len(top)] = [hydrated.get(q['id'], q) for q in top]
+
+        return papers
+
+    def _hydrate_openalex(self, ids: List[str]) -> List[Dict]:
+        """按OpenAlex ID批量补全完整论文记录
+
+        openalex_id过滤器支持"|"分隔一次传约50个ID，各批次在
+        令牌桶限速下并发抓取。
+        """
+        if not ids:
+            return []
+
+        chunks = [ids[i:i + 50] for i in range(0, len(ids), 50)]
+
+        def fetch_chunk(chunk: List[str]) -> List[Dict]:
+            self._limiters['openalex'].acquire()
+            response = self.session.get(
+                f"{self.openalex_base}/works",
+                params={
+                    'filter': 'openalex_id:' + '|'.join(chunk),
+                    'per_page': len(chunk),
+                    'select': _OPENALEX_SELECT_FULL,
+                    'mailto': _OPENALEX_MAILTO
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+            results = _json_loads(response.content).get('results', [])
+            return [paper for paper in map(self._parse_openalex_paper, results) if paper]
+
+        papers = []
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+            futures = [executor.submit(fetch_chunk, chunk) for chunk in chunks]
+            for future in futures:
+                try:
+                    papers.extend(future.result())
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"OpenAlex批量补全失败: {e}")
+
+        return papers
+
+
     def _parse_openalex_paper(self, item: Dict) -> Optional[Dict]:
         """解析OpenAlex论文数据"""
         try:
             # 还原倒排索引格式的摘要
             abstract = ""
             if item.get('abstract_inverted_index'):
-                inv_index = item['abstract_inverted_index']
-                words = {}
-                for word, positions in inv_index.items():
-                    for pos in positions:
-                        words[pos] = word
-                abstract = ' '.join(words[i] for i in sorted(words.keys()))
+                abstract = _decode_inverted_index(item['abstract_inverted_index'])
             
             # 提取作者
             authors = []
@@ -185,17 +378,18 @@ class DataFetcher:
             if location and location.get('source'):
                 journal = location['source'].get('display_name', '')
             
-            # 提取关键词
-            keywords = []
+            # 提取关键词（dict按插入序去重，省去末尾再建一次set的开销，
+            # 且保留concepts在前、作者关键词在后的原始顺序）
+            kw_seen = {}
             for concept in item.get('concepts', [])[:15]:
                 if concept.get('display_name'):
-                    keywords.append(concept['display_name'].lower())
-            
+                    kw_seen[concept['display_name'].lower()] = None
+
             # 添加作者关键词
             for kw in item.get('keywords', []):
                 if kw.get('keyword'):
-                    keywords.append(kw['keyword'].lower())
-            
+                    kw_seen[kw['keyword'].lower()] = None
+
             return {
                 'id': item.get('id', ''),
                 'doi': item.get('doi', '').replace('https://doi.org/', '') if item.get('doi') else '',
@@ -204,7 +398,7 @@ class DataFetcher:
                 'year': item.get('publication_year'),
                 'journal': journal,
                 'abstract': abstract,
-                'keywords': list(set(keywords)),
+                'keywords': list(kw_seen),
                 'citations': item.get('cited_by_count', 0),
                 'source': 'openalex'
             }
@@ -214,54 +408,69 @@ class DataFetcher:
     
     def _fetch_from_semantic_scholar(self, keywords: List[str], year_start: int,
                                      year_end: int, max_results: int) -> List[Dict]:
-        """从Semantic Scholar获取数据"""
-        papers = []
+        """从Semantic Scholar获取数据
+
+        首页请求探测total，其余offset页并发抓取（网络往返相互重叠），
+        不再逐页串行等待。
+        """
         query = ' '.join(keywords)
-        
-        params = {
+        limit = min(100, max_results)
+
+        base_params = {
             'query': query,
             'year': f"{year_start}-{year_end}",
             'fields': 'paperId,externalIds,title,abstract,year,authors,venue,citationCount,fieldsOfStudy',
-            'limit': min(100, max_results),
-            'offset': 0
+            'limit': limit
         }
-        
-        while len(papers) < max_results:
-            try:
+
+        def fetch_page(offset: int) -> Dict:
+            while True:
+                self._limiters['semantic_scholar'].acquire()
                 response = self.session.get(
                     f"{self.semantic_scholar_base}/paper/search",
-                    params=params,
+                    params=dict(base_params, offset=offset),
                     timeout=30
                 )
-                
+
                 if response.status_code == 429:
-                    logger.warning("Semantic Scholar API速率限制，等待...")
-                    time.sleep(60)
+                    # 被限流时按服务端Retry-After等待后重试
+                    wait = float(response.headers.get('Retry-After', 60))
+                    logger.warning(f"Semantic Scholar API速率限制，等待{wait:.0f}秒...")
+                    time.sleep(wait)
                     continue
-                
+
                 response.raise_for_status()
-                data = response.json()
-                
-                results = data.get('data', [])
-                if not results:
-                    break
-                
-                for item in results:
-                    paper = self._parse_semantic_scholar_paper(item)
-                    if paper:
-                        papers.append(paper)
-                
-                params['offset'] += len(results)
-                
-                if data.get('total', 0) <= params['offset']:
-                    break
-                
-                time.sleep(1)  # 遵守速率限制
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Semantic Scholar API请求失败: {e}")
-                break
-        
+                return _json_loads(response.content)
+
+        try:
+            first = fetch_page(0)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Semantic Scholar API请求失败: {e}")
+            return []
+
+        papers = []
+        for item in first.get('data', []):
+            paper = self._parse_semantic_scholar_paper(item)
+            if paper:
+                papers.append(paper)
+
+        # 按首页的total预计算其余offset；S2免认证限速严格，低并发即可
+        total = min(first.get('total', 0), max_results)
+        offsets = range(limit, total, limit)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(fetch_page, offset) for offset in offsets]
+                for future in futures:  # 按offset顺序消费，保持结果稳定
+                    try:
+                        data = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"Semantic Scholar API请求失败: {e}")
+                        continue
+                    for item in data.get('data', []):
+                        paper = self._parse_semantic_scholar_paper(item)
+                        if paper:
+                            papers.append(paper)
+
         return papers[:max_results]
     
     def _parse_semantic_scholar_paper(self, item: Dict) -> Optional[Dict]:
@@ -296,49 +505,59 @@ class DataFetcher:
     
     def _fetch_from_crossref(self, keywords: List[str], year_start: int,
                             year_end: int, max_results: int) -> List[Dict]:
-        """从Crossref获取数据"""
-        papers = []
+        """从Crossref获取数据
+
+        与Semantic Scholar同构：首页探测total-results，
+        其余offset页并发抓取。
+        """
         query = ' '.join(keywords)
-        
-        params = {
+        rows = min(100, max_results)
+
+        base_params = {
             'query': query,
             'filter': f"from-pub-date:{year_start},until-pub-date:{year_end},type:journal-article",
-            'rows': min(100, max_results),
-            'offset': 0,
+            'rows': rows,
             'select': 'DOI,title,author,published-print,container-title,abstract,is-referenced-by-count,subject'
         }
-        
-        while len(papers) < max_results:
-            try:
-                response = self.session.get(
-                    f"{self.crossref_base}/works",
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                items = data.get('message', {}).get('items', [])
-                if not items:
-                    break
-                
-                for item in items:
-                    paper = self._parse_crossref_paper(item)
-                    if paper:
-                        papers.append(paper)
-                
-                params['offset'] += len(items)
-                
-                total = data.get('message', {}).get('total-results', 0)
-                if total <= params['offset']:
-                    break
-                
-                time.sleep(0.5)  # 礼貌性延迟
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Crossref API请求失败: {e}")
-                break
-        
+
+        def fetch_page(offset: int) -> Dict:
+            self._limiters['crossref'].acquire()
+            response = self.session.get(
+                f"{self.crossref_base}/works",
+                params=dict(base_params, offset=offset),
+                timeout=30
+            )
+            response.raise_for_status()
+            return _json_loads(response.content).get('message', {})
+
+        try:
+            first = fetch_page(0)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Crossref API请求失败: {e}")
+            return []
+
+        papers = []
+        for item in first.get('items', []):
+            paper = self._parse_crossref_paper(item)
+            if paper:
+                papers.append(paper)
+
+        total = min(first.get('total-results', 0), max_results)
+        offsets = range(rows, total, rows)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(fetch_page, offset) for offset in offsets]
+                for future in futures:  # 按offset顺序消费，保持结果稳定
+                    try:
+                        message = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"Crossref API请求失败: {e}")
+                        continue
+                    for item in message.get('items', []):
+                        paper = self._parse_crossref_paper(item)
+                        if paper:
+                            papers.append(paper)
+
         return papers[:max_results]
     
     def _parse_crossref_paper(self, item: Dict) -> Optional[Dict]:
@@ -389,41 +608,86 @@ class DataFetcher:
             logger.debug(f"解析论文失败: {e}")
             return None
     
+    def _crossref_batch_dois(self, dois: List[str]) -> List[Dict]:
+        """按DOI批量查询Crossref元数据
+
+        Crossref的filter支持一次传入多个doi:条件（约100个/请求），
+        把逐DOI查询的N次网络往返压缩成N/100次；各批次在令牌桶
+        限速下并发抓取，结果保持传入DOI批次的顺序。
+        """
+        if not dois:
+            return []
+
+        chunks = [dois[i:i + 100] for i in range(0, len(dois), 100)]
+
+        def fetch_chunk(chunk: List[str]) -> List[Dict]:
+            self._limiters['crossref'].acquire()
+            response = self.session.get(
+                f"{self.crossref_base}/works",
+                params={
+                    'filter': ','.join(f'doi:{doi}' for doi in chunk),
+                    'rows': len(chunk),
+                    'select': 'DOI,title,author,published-print,container-title,abstract,is-referenced-by-count,subject'
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+            items = _json_loads(response.content).get('message', {}).get('items', [])
+            return [paper for paper in map(self._parse_crossref_paper, items) if paper]
+
+        papers = []
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+            futures = [executor.submit(fetch_chunk, chunk) for chunk in chunks]
+            for future in futures:  # 按批次顺序消费，保持结果稳定
+                try:
+                    papers.extend(future.result())
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Crossref批量DOI查询失败: {e}")
+
+        return papers
+
     def fetch_tourism_journals(self, year_start: int = 2024, year_end: int = 2026,
                                max_per_journal: int = 100) -> List[Dict]:
-        """专门获取旅游类SSCI期刊的论文"""
-        all_papers = []
-        
-        for journal_name, journal_id in self.tourism_journals.items():
+        """专门获取旅游类SSCI期刊的论文
+
+        8本期刊的请求相互独立，用4个工作线程并发抓取，
+        网络往返重叠后总耗时约为串行+逐期刊sleep的1/4；
+        并发上限同时兼作OpenAlex的礼貌限速。
+        """
+        def fetch_journal(journal_name: str, journal_id: str) -> List[Dict]:
             logger.info(f"正在获取 {journal_name} 的论文...")
-            
+
             params = {
                 'filter': f"primary_location.source.id:{journal_id},publication_year:{year_start}-{year_end},has_abstract:true",
                 'per_page': min(200, max_per_journal),
                 'sort': 'publication_date:desc',
-                'select': 'id,doi,title,publication_year,abstract_inverted_index,authorships,primary_location,cited_by_count,concepts,keywords'
+                'select': _OPENALEX_SELECT_FULL,
+                'mailto': _OPENALEX_MAILTO
             }
-            
-            try:
-                response = self.session.get(
-                    f"{self.openalex_base}/works",
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                for item in data.get('results', []):
-                    paper = self._parse_openalex_paper(item)
-                    if paper:
-                        all_papers.append(paper)
-                
-                logger.info(f"  获取到 {len(data.get('results', []))} 篇")
-                time.sleep(0.2)
-                
-            except Exception as e:
-                logger.error(f"获取 {journal_name} 失败: {e}")
-        
+
+            self._limiters['openalex'].acquire()
+            response = self.session.get(
+                f"{self.openalex_base}/works",
+                params=params,
+                timeout=30
+            )
+            response.raise_for_status()
+            results = _json_loads(response.content).get('results', [])
+            logger.info(f"  {journal_name}: 获取到 {len(results)} 篇")
+            return [paper for paper in map(self._parse_openalex_paper, results) if paper]
+
+        all_papers = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                journal_name: executor.submit(fetch_journal, journal_name, journal_id)
+                for journal_name, journal_id in self.tourism_journals.items()
+            }
+            for journal_name, future in futures.items():  # 保持期刊定义顺序
+                try:
+                    all_papers.extend(future.result())
+                except Exception as e:
+                    logger.error(f"获取 {journal_name} 失败: {e}")
+
         return all_papers
     
     def generate_demo_data(self, n: int = 200) -> List[Dict]:
@@ -444,41 +708,55 @@ class DataFetcher:
         
         journals = list(self.tourism_journals.keys())
         years = [2024, 2025, 2026]
-        
+
+        # 专用RNG实例 + 批量抽样：module级random每次调用都要过共享实例，
+        # 热点字段一次choices(k=n)批量抽完，论文循环内只做下标索引
+        rng = random.Random()
+        topic_draws = rng.choices(topics, k=n)
+        year_draws = rng.choices(years, weights=[0.3, 0.4, 0.3], k=n)
+        journal_draws = rng.choices(journals, k=n)
+        author_counts = rng.choices(range(2, 6), k=n)
+        study_draws = rng.choices(['Systematic Review', 'Empirical Study', 'Case Study',
+                                   'Conceptual Framework', 'Mixed-Methods Analysis'], k=n)
+        region_draws = rng.choices(['Chinese', 'European', 'American', 'Asian', 'Global'], k=n)
+        object_draws = rng.choices(['Tourists', 'Hotels', 'Destinations',
+                                    'Travel Agencies', 'Airlines'], k=n)
+
         papers = []
         for i in range(n):
-            topic_name, topic_keywords = random.choice(topics)
-            year = random.choices(years, weights=[0.3, 0.4, 0.3])[0]
-            
+            topic_name, topic_keywords = topic_draws[i]
+            year = year_draws[i]
+
             # 生成模拟论文
             paper = {
                 'id': f'demo_{i}',
                 'doi': f'10.1000/demo.{year}.{i}',
-                'title': f"{topic_name}: A {random.choice(['Systematic Review', 'Empirical Study', 'Case Study', 'Conceptual Framework', 'Mixed-Methods Analysis'])} of {random.choice(['Chinese', 'European', 'American', 'Asian', 'Global'])} {random.choice(['Tourists', 'Hotels', 'Destinations', 'Travel Agencies', 'Airlines'])}",
-                'authors': [f"Author {j}" for j in range(random.randint(2, 5))],
+                'title': f"{topic_name}: A {study_draws[i]} of {region_draws[i]} {object_draws[i]}",
+                'authors': [f"Author {j}" for j in range(author_counts[i])],
                 'year': year,
-                'journal': random.choice(journals),
-                'abstract': self._generate_demo_abstract(topic_name, topic_keywords),
-                'keywords': random.sample(topic_keywords, min(4, len(topic_keywords))) + random.sample(['tourism', 'hospitality', 'travel', 'experience'], 2),
-                'citations': random.randint(0, 150) if year < 2026 else random.randint(0, 20),
+                'journal': journal_draws[i],
+                'abstract': self._generate_demo_abstract(topic_name, topic_keywords, rng),
+                'keywords': rng.sample(topic_keywords, min(4, len(topic_keywords))) + rng.sample(['tourism', 'hospitality', 'travel', 'experience'], 2),
+                'citations': rng.randint(0, 150) if year < 2026 else rng.randint(0, 20),
                 'source': 'demo',
-                'limitations_future_research': self._generate_demo_limitations()
+                'limitations_future_research': self._generate_demo_limitations(rng)
             }
             papers.append(paper)
         
         logger.info(f"生成了 {len(papers)} 篇演示论文")
         return papers
     
-    def _generate_demo_abstract(self, topic: str, keywords: List[str]) -> str:
+    def _generate_demo_abstract(self, topic: str, keywords: List[str],
+                                rng: random.Random = random) -> str:
         """生成模拟摘要"""
         templates = [
-            f"This study examines the impact of {keywords[0]} on the tourism industry. Using {random.choice(['quantitative', 'qualitative', 'mixed-methods'])} research design, we analyzed data from {random.randint(200, 1000)} respondents. Results indicate that {keywords[1]} significantly influences tourist satisfaction. The findings have important implications for {random.choice(['destination marketing', 'hospitality management', 'tourism policy'])}. Limitations include sample size and geographic scope. Future research should explore {keywords[2]} in different cultural contexts.",
-            f"The purpose of this research is to investigate how {keywords[0]} transforms tourist experiences. Drawing on {random.choice(['technology acceptance model', 'service quality theory', 'consumer behavior theory'])}, we propose a conceptual framework. An empirical study of {random.randint(150, 500)} tourists validates our model. Key findings suggest that {keywords[1]} enhances {random.choice(['engagement', 'satisfaction', 'loyalty'])}. This study contributes to the literature on {topic.lower()} and provides practical recommendations for industry practitioners.",
-            f"Tourism scholars have increasingly focused on {keywords[0]}, yet limited research examines its relationship with {keywords[1]}. This paper addresses this gap through a {random.choice(['systematic literature review', 'meta-analysis', 'longitudinal study'])}. We identified {random.randint(50, 200)} relevant articles published between 2020 and 2026. Our analysis reveals emerging trends in {keywords[2]} research. The study concludes with a research agenda highlighting opportunities for future investigation."
+            f"This study examines the impact of {keywords[0]} on the tourism industry. Using {rng.choice(['quantitative', 'qualitative', 'mixed-methods'])} research design, we analyzed data from {rng.randint(200, 1000)} respondents. Results indicate that {keywords[1]} significantly influences tourist satisfaction. The findings have important implications for {rng.choice(['destination marketing', 'hospitality management', 'tourism policy'])}. Limitations include sample size and geographic scope. Future research should explore {keywords[2]} in different cultural contexts.",
+            f"The purpose of this research is to investigate how {keywords[0]} transforms tourist experiences. Drawing on {rng.choice(['technology acceptance model', 'service quality theory', 'consumer behavior theory'])}, we propose a conceptual framework. An empirical study of {rng.randint(150, 500)} tourists validates our model. Key findings suggest that {keywords[1]} enhances {rng.choice(['engagement', 'satisfaction', 'loyalty'])}. This study contributes to the literature on {topic.lower()} and provides practical recommendations for industry practitioners.",
+            f"Tourism scholars have increasingly focused on {keywords[0]}, yet limited research examines its relationship with {keywords[1]}. This paper addresses this gap through a {rng.choice(['systematic literature review', 'meta-analysis', 'longitudinal study'])}. We identified {rng.randint(50, 200)} relevant articles published between 2020 and 2026. Our analysis reveals emerging trends in {keywords[2]} research. The study concludes with a research agenda highlighting opportunities for future investigation."
         ]
-        return random.choice(templates)
-    
-    def _generate_demo_limitations(self) -> str:
+        return rng.choice(templates)
+
+    def _generate_demo_limitations(self, rng: random.Random = random) -> str:
         """生成模拟的研究局限性和未来研究建议"""
         limitations = [
             "This study has several limitations that future research should address. First, the sample was limited to a single country, reducing generalizability. Second, the cross-sectional design prevents causal inferences. Third, we relied on self-reported data which may be subject to social desirability bias.",
@@ -492,4 +770,4 @@ class DataFetcher:
             "This study opens opportunities for future investigation. The impact of sustainability certifications on tourist trust requires further examination. Research on the effectiveness of different green marketing strategies across market segments would be valuable. Action research involving industry collaboration is recommended."
         ]
         
-        return random.choice(limitations) + " " + random.choice(future_research)
+        return rng.choice(limitations) + " " + rng.choice(future_research)
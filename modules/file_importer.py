@@ -11,9 +11,10 @@
 """
 
 import csv
+import io
 import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,90 @@ class FileImporter:
     
     def __init__(self):
         pass
-    
+
+    def import_file(self, src, suffix: Optional[str] = None) -> List[Dict]:
+        """
+        导入文件或内存中的文件内容
+
+        Args:
+            src: 文件路径、bytes，或带read()方法的文件对象
+                 （如Streamlit的UploadedFile）
+            suffix: 格式提示（'csv'/'txt'/'bib'/'ris'），
+                    内存输入无路径时用于判断格式
+
+        内存输入直接在内存中解析，不落盘。
+        """
+        # 路径输入：沿用基于文件的自动导入
+        if isinstance(src, (str, Path)):
+            return self.import_auto(str(src))
+
+        # 文件对象：一次性读入bytes
+        if hasattr(src, 'read'):
+            if suffix is None:
+                name = getattr(src, 'name', '')
+                suffix = Path(name).suffix.lstrip('.') if name else None
+            src = src.read()
+
+        if isinstance(src, bytes):
+            content = self._decode_bytes(src)
+        else:
+            content = src
+
+        if not content:
+            logger.error("无法解码输入内容")
+            return []
+
+        format_type = self._detect_content_format(content, suffix)
+
+        if format_type == 'wos':
+            return self._parse_wos_content(content)
+        elif format_type == 'bibtex':
+            return self._parse_bibtex_content(content)
+        elif format_type == 'ris':
+            return self._parse_ris_content(content)
+        elif format_type == 'scopus':
+            return self._parse_scopus_content(content)
+        else:
+            return self._parse_generic_csv_content(content)
+
+    def _decode_bytes(self, buf: bytes) -> Optional[str]:
+        """尝试多种编码解码bytes"""
+        for encoding in ['utf-8-sig', 'utf-8', 'utf-16', 'latin-1', 'cp1252']:
+            try:
+                return buf.decode(encoding)
+            except (UnicodeDecodeError, UnicodeError):
+                continue
+        return None
+
+    def _detect_content_format(self, content: str, suffix: Optional[str] = None) -> str:
+        """根据后缀提示和内容特征判断格式"""
+        suffix = (suffix or '').lower().lstrip('.')
+
+        if suffix == 'bib':
+            return 'bibtex'
+        if suffix == 'ris':
+            return 'ris'
+
+        head = content[:2048]
+        first_line = head.split('\n', 1)[0]
+
+        if suffix == 'txt' or suffix == '':
+            if first_line.startswith('FN ') or first_line.startswith('PT '):
+                return 'wos'
+        if suffix == 'csv':
+            header = first_line.lower()
+            if 'eid' in header or 'scopus' in header:
+                return 'scopus'
+            return 'csv'
+
+        # 无后缀时的内容嗅探
+        if head.lstrip().startswith('@'):
+            return 'bibtex'
+        if re.match(r'^TY\s+-', head.lstrip()):
+            return 'ris'
+
+        return 'csv'
+
     def import_wos(self, filepath: str) -> List[Dict]:
         """
         导入Web of Science导出文件
@@ -46,14 +130,10 @@ class FileImporter:
         - FX: Funding Text (资助信息，常包含limitations)
         """
         filepath = Path(filepath)
-        
+
         if filepath.suffix.lower() == '.bib':
             return self._import_bibtex(filepath)
-        
-        papers = []
-        current_paper = {}
-        current_field = None
-        
+
         try:
             # 尝试多种编码
             for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
@@ -66,9 +146,22 @@ class FileImporter:
             else:
                 logger.error(f"无法解码文件: {filepath}")
                 return []
-            
+
+            return self._parse_wos_content(content)
+
+        except Exception as e:
+            logger.error(f"导入WoS文件失败: {e}")
+            return []
+
+    def _parse_wos_content(self, content: str) -> List[Dict]:
+        """解析WoS纯文本内容"""
+        papers = []
+        current_paper = {}
+        current_field = None
+
+        try:
             lines = content.split('\n')
-            
+
             for line in lines:
                 # 跳过空行
                 if not line.strip():
@@ -121,11 +214,11 @@ class FileImporter:
                 if paper:
                     papers.append(paper)
             
-            logger.info(f"从WoS文件导入 {len(papers)} 篇论文")
+            logger.info(f"从WoS数据导入 {len(papers)} 篇论文")
             return papers
-            
+
         except Exception as e:
-            logger.error(f"导入WoS文件失败: {e}")
+            logger.error(f"解析WoS内容失败: {e}")
             return []
     
     def _parse_wos_paper(self, record: Dict) -> Optional[Dict]:
@@ -200,38 +293,54 @@ class FileImporter:
         - DOI: DOI
         """
         filepath = Path(filepath)
-        
+
         if filepath.suffix.lower() == '.bib':
             return self._import_bibtex(filepath)
-        
+
+        content = self._read_text_file(filepath, encodings=['utf-8-sig', 'utf-8', 'latin-1', 'cp1252'])
+        if content is None:
+            return []
+
+        return self._parse_scopus_content(content)
+
+    def _parse_scopus_content(self, content: str) -> List[Dict]:
+        """解析Scopus CSV内容"""
         papers = []
-        
+
         try:
-            # 尝试多种编码
-            for encoding in ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252']:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        # 检测分隔符
-                        sample = f.read(8192)
-                        f.seek(0)
-                        
-                        dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
-                        reader = csv.DictReader(f, dialect=dialect)
-                        
-                        for row in reader:
-                            paper = self._parse_scopus_row(row)
-                            if paper:
-                                papers.append(paper)
-                    break
-                except (UnicodeDecodeError, csv.Error):
-                    continue
-            
-            logger.info(f"从Scopus文件导入 {len(papers)} 篇论文")
+            for row in self._csv_rows(content):
+                paper = self._parse_scopus_row(row)
+                if paper:
+                    papers.append(paper)
+
+            logger.info(f"从Scopus数据导入 {len(papers)} 篇论文")
             return papers
-            
+
         except Exception as e:
-            logger.error(f"导入Scopus文件失败: {e}")
+            logger.error(f"解析Scopus内容失败: {e}")
             return []
+
+    def _read_text_file(self, filepath, encodings) -> Optional[str]:
+        """尝试多种编码读取文本文件"""
+        for encoding in encodings:
+            try:
+                with open(filepath, 'r', encoding=encoding) as f:
+                    return f.read()
+            except UnicodeDecodeError:
+                continue
+            except OSError as e:
+                logger.error(f"读取文件失败: {e}")
+                return None
+        logger.error(f"无法解码文件: {filepath}")
+        return None
+
+    def _csv_rows(self, content: str):
+        """从CSV内容中迭代DictReader行（自动嗅探分隔符）"""
+        try:
+            dialect = csv.Sniffer().sniff(content[:8192], delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        return csv.DictReader(io.StringIO(content), dialect=dialect)
     
     def _parse_scopus_row(self, row: Dict) -> Optional[Dict]:
         """解析Scopus CSV行"""
@@ -311,29 +420,27 @@ class FileImporter:
         - citations/cited: 被引次数
         - doi: DOI
         """
+        content = self._read_text_file(filepath, encodings=['utf-8-sig', 'utf-8', 'latin-1', 'cp1252'])
+        if content is None:
+            return []
+
+        return self._parse_generic_csv_content(content)
+
+    def _parse_generic_csv_content(self, content: str) -> List[Dict]:
+        """解析通用CSV内容"""
         papers = []
-        
+
         try:
-            for encoding in ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252']:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        dialect = csv.Sniffer().sniff(f.read(8192), delimiters=',;\t')
-                        f.seek(0)
-                        reader = csv.DictReader(f, dialect=dialect)
-                        
-                        for row in reader:
-                            paper = self._parse_generic_csv_row(row)
-                            if paper:
-                                papers.append(paper)
-                    break
-                except (UnicodeDecodeError, csv.Error):
-                    continue
-            
-            logger.info(f"从CSV文件导入 {len(papers)} 篇论文")
+            for row in self._csv_rows(content):
+                paper = self._parse_generic_csv_row(row)
+                if paper:
+                    papers.append(paper)
+
+            logger.info(f"从CSV数据导入 {len(papers)} 篇论文")
             return papers
-            
+
         except Exception as e:
-            logger.error(f"导入CSV文件失败: {e}")
+            logger.error(f"解析CSV内容失败: {e}")
             return []
     
     def _parse_generic_csv_row(self, row: Dict) -> Optional[Dict]:
@@ -392,25 +499,33 @@ class FileImporter:
     
     def _import_bibtex(self, filepath: str) -> List[Dict]:
         """导入BibTeX格式"""
-        papers = []
-        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
+        except Exception as e:
+            logger.error(f"导入BibTeX文件失败: {e}")
+            return []
+
+        return self._parse_bibtex_content(content)
+
+    def _parse_bibtex_content(self, content: str) -> List[Dict]:
+        """解析BibTeX内容"""
+        papers = []
+
+        try:
             # 简单的BibTeX解析
             entries = re.findall(r'@\w+\{([^@]+)\}', content, re.DOTALL)
-            
+
             for entry in entries:
                 paper = self._parse_bibtex_entry(entry)
                 if paper:
                     papers.append(paper)
-            
-            logger.info(f"从BibTeX文件导入 {len(papers)} 篇论文")
+
+            logger.info(f"从BibTeX数据导入 {len(papers)} 篇论文")
             return papers
-            
+
         except Exception as e:
-            logger.error(f"导入BibTeX文件失败: {e}")
+            logger.error(f"解析BibTeX内容失败: {e}")
             return []
     
     def _parse_bibtex_entry(self, entry: str) -> Optional[Dict]:
@@ -479,45 +594,55 @@ class FileImporter:
         - KW: 关键词
         - DO: DOI
         """
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            logger.error(f"导入RIS文件失败: {e}")
+            return []
+
+        return self._parse_ris_content(content)
+
+    def _parse_ris_content(self, content: str) -> List[Dict]:
+        """解析RIS内容"""
         papers = []
         current_paper = {}
-        
+
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    if not line:
+            for line in content.split('\n'):
+                line = line.strip()
+
+                if not line:
+                    continue
+
+                # RIS格式: XX  - value
+                match = re.match(r'^([A-Z][A-Z0-9])\s+-\s+(.*)$', line)
+
+                if match:
+                    tag, value = match.groups()
+
+                    # 记录结束
+                    if tag == 'ER':
+                        if current_paper:
+                            paper = self._parse_ris_record(current_paper)
+                            if paper:
+                                papers.append(paper)
+                        current_paper = {}
                         continue
-                    
-                    # RIS格式: XX  - value
-                    match = re.match(r'^([A-Z][A-Z0-9])\s+-\s+(.*)$', line)
-                    
-                    if match:
-                        tag, value = match.groups()
-                        
-                        # 记录结束
-                        if tag == 'ER':
-                            if current_paper:
-                                paper = self._parse_ris_record(current_paper)
-                                if paper:
-                                    papers.append(paper)
-                            current_paper = {}
-                            continue
-                        
-                        # 多值字段
-                        if tag in ['AU', 'A1', 'KW']:
-                            if tag not in current_paper:
-                                current_paper[tag] = []
-                            current_paper[tag].append(value)
-                        else:
-                            current_paper[tag] = value
-            
-            logger.info(f"从RIS文件导入 {len(papers)} 篇论文")
+
+                    # 多值字段
+                    if tag in ['AU', 'A1', 'KW']:
+                        if tag not in current_paper:
+                            current_paper[tag] = []
+                        current_paper[tag].append(value)
+                    else:
+                        current_paper[tag] = value
+
+            logger.info(f"从RIS数据导入 {len(papers)} 篇论文")
             return papers
-            
+
         except Exception as e:
-            logger.error(f"导入RIS文件失败: {e}")
+            logger.error(f"解析RIS内容失败: {e}")
             return []
     
     def _parse_ris_record(self, record: Dict) -> Optional[Dict]:
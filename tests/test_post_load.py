@@ -0,0 +1,65 @@
+"""_post_load的dtype收窄回归测试
+
+重点覆盖OpenAlex抓取路径的记录形状：authors是字符串列表（不可哈希），
+_post_load不能对其做category转换，否则每次成功抓取都会在入库时崩溃。
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from app import _post_load
+
+
+def _openalex_shaped_papers():
+    """与data_fetcher._parse_openalex_paper返回结构一致的记录"""
+    return [
+        {
+            'id': 'W1',
+            'doi': '10.1000/x.1',
+            'title': 'Smart Tourism Adoption',
+            'authors': ['Author A', 'Author B'],
+            'year': 2025,
+            'journal': 'Tourism Management',
+            'abstract': 'An abstract.',
+            'keywords': ['smart tourism', 'iot'],
+            'citations': 12,
+            'source': 'openalex',
+        },
+        {
+            'id': 'W2',
+            'doi': '10.1000/x.2',
+            'title': 'Heritage Tourism Experience',
+            'authors': ['Author C'],
+            'year': 2024,
+            'journal': 'Annals of Tourism Research',
+            'abstract': 'Another abstract.',
+            'keywords': ['heritage'],
+            'citations': 3,
+            'source': 'openalex',
+        },
+    ]
+
+
+def test_post_load_roundtrips_openalex_records():
+    df = _post_load(pd.DataFrame(_openalex_shaped_papers()))
+
+    # 列表值原样保留，不被category化
+    assert df['authors'].tolist() == [['Author A', 'Author B'], ['Author C']]
+    assert df['authors'].dtype == object
+
+    # 数值列收窄、journal转category的优化仍然生效
+    assert df['year'].dtype == 'int16'
+    assert df['citations'].dtype == 'int32'
+    assert isinstance(df['journal'].dtype, pd.CategoricalDtype)
+    assert df['journal'].tolist() == ['Tourism Management', 'Annals of Tourism Research']
+
+
+def test_post_load_handles_prejoined_author_strings():
+    papers = _openalex_shaped_papers()
+    for paper in papers:
+        paper['authors'] = '; '.join(paper['authors'])
+
+    df = _post_load(pd.DataFrame(papers))
+    assert df['authors'].tolist() == ['Author A; Author B', 'Author C']